@@ -3,8 +3,8 @@
 fix_svg_margins.py — batch-fix "transparent margins" in SVGs
 
 Usage:
-  python fix_svg_margins.py INPUT [INPUT ...] [-o OUTDIR] [--method M] [--padding P] [--keep-size]
-  python fix_svg_margins.py DIR [-o OUTDIR] [--method M] [--padding P] [--keep-size]
+  python fix_svg_margins.py INPUT [INPUT ...] [-o OUTDIR] [--method M] [--padding P] [--keep-size] [-j N] [--io-uring]
+  python fix_svg_margins.py DIR [-o OUTDIR] [--method M] [--padding P] [--keep-size] [-j N] [--io-uring]
 
 Methods:
   - inkscape      : run Inkscape CLI to crop to drawing (requires Inkscape)  [RECOMMENDED]
@@ -18,14 +18,38 @@ Examples:
 
 Notes:
   • Output files always keep the SAME base name as input and end with .svg in the chosen OUTDIR.
-  • Inkscape uses --export-area-drawing to crop to actual content bounds.
+  • Inkscape uses --export-area-drawing to crop to actual content bounds. With several
+    inputs each worker drives one `inkscape --shell` process over its share of the batch.
+    Files a shell cannot handle fall back to one-shot CLI runs, -j of them at a time.
+  • Files are processed in parallel (-j/--jobs): processes for svgelements/aspect-*,
+    threads for inkscape.
+  • --io-uring reads every input in one io_uring batch before parsing, and defers all writes
+    until every file is processed, then submits them in one batch too
+    (pip install liburing; falls back to threaded reads / pwrite).
+  • lxml (pip install lxml) is used for parsing/serializing when available; otherwise
+    the stdlib xml.etree.ElementTree is used.
 """
 
 import argparse
+import asyncio
+import io
+import os
+import re
+import shutil
 import sys
 import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-import xml.etree.ElementTree as ET
+
+try:
+    import lxml.etree as ET
+    HAVE_LXML = True
+    XML_PARSE_ERRORS = (ET.XMLSyntaxError,)
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAVE_LXML = False
+    XML_PARSE_ERRORS = (ET.ParseError,)
 
 # ---------- utility ----------
 
@@ -34,8 +58,8 @@ def find_svgs(inputs):
     for p in inputs:
         pth = Path(p)
         if pth.is_dir():
-            files.extend(sorted(pth.rglob("*.svg")))
-            files.extend(sorted(pth.rglob("*.SVG")))
+            # one walk, case-insensitive extension match (.svg, .SVG, ...)
+            files.extend(sorted(f for f in pth.rglob("*") if f.suffix.lower() == ".svg" and f.is_file()))
         elif pth.is_file() and pth.suffix.lower() == ".svg":
             files.append(pth)
         else:
@@ -43,28 +67,35 @@ def find_svgs(inputs):
             for g in Path().glob(p):
                 if g.is_file() and g.suffix.lower() == ".svg":
                     files.append(g)
-    # dedupe
-    seen = set()
-    uniq = []
-    for f in files:
-        if f not in seen:
-            uniq.append(f)
-            seen.add(f)
-    return uniq
+    # dedupe, keeping first-seen order
+    return list(dict.fromkeys(files))
 
 def ensure_outdir(outdir):
     outdir.mkdir(parents=True, exist_ok=True)
 
-def load_xml(path):
+def xml_source(path, data=None):
+    # parsers accept either a filename or a file object; use the pre-read bytes when we have them
+    return io.BytesIO(data) if data is not None else str(path)
+
+def parse_xml(path, data=None):
+    # lxml needs huge_tree for slides with very large embedded images / path data
+    if HAVE_LXML:
+        return ET.parse(xml_source(path, data), parser=ET.XMLParser(huge_tree=True, remove_blank_text=False))
+    return ET.parse(xml_source(path, data))
+
+def load_xml(path, data=None):
     try:
-        tree = ET.parse(path)
+        tree = parse_xml(path, data)
         return tree
-    except ET.ParseError as e:
+    except XML_PARSE_ERRORS as e:
         print(f"[WARN] Failed to parse {path}: {e}", file=sys.stderr)
         return None
 
 def get_viewbox_dims(svg_root):
-    vb = svg_root.attrib.get("viewBox")
+    return viewbox_from_attrib(svg_root.attrib)
+
+def viewbox_from_attrib(attrib):
+    vb = attrib.get("viewBox")
     if not vb:
         return None
     parts = vb.strip().split()
@@ -73,22 +104,216 @@ def get_viewbox_dims(svg_root):
     minx, miny, vbw, vbh = [float(x) for x in parts]
     return minx, miny, vbw, vbh
 
-def write_tree(tree, out_path):
-    tree.write(out_path, encoding="utf-8", xml_declaration=True, method="xml")
+def read_root_attrib(path, data=None):
+    # Stop at the first start event: only the root <svg> element is built, not the body
+    try:
+        with (io.BytesIO(data) if data is not None else open(path, "rb")) as f:
+            for _, elem in ET.iterparse(f, events=("start",)):
+                return dict(elem.attrib)
+    except XML_PARSE_ERRORS as e:
+        print(f"[WARN] Failed to parse {path}: {e}", file=sys.stderr)
+    return None
+
+# opening <svg ...> tag (optionally prefixed), honouring quoted attribute values
+SVG_OPEN_TAG_RE = re.compile(rb"""<(?:[\w.-]+:)?svg\b(?:[^>"']|"[^"]*"|'[^']*')*>""")
+# everything allowed before the root element: BOM, whitespace, XML declaration / PIs, comments, DOCTYPE
+XML_PROLOG_RE = re.compile(rb"""(?:\xef\xbb\xbf|\s+|<\?.*?\?>|<!--.*?-->|<!DOCTYPE(?:[^\[>]|\[.*?\])*>)*""", re.S)
+
+def set_tag_attr(tag, name, value):
+    """Set attribute `name` inside a raw opening tag (bytes), replacing or appending it."""
+    attr = re.compile(rb"""(\s)""" + re.escape(name.encode()) + rb"""\s*=\s*(?:"[^"]*"|'[^']*')""")
+    new = f'{name}="{value}"'.encode()
+    if attr.search(tag):
+        return attr.sub(lambda m: m.group(1) + new, tag, count=1)
+    end = len(tag) - 2 if tag.endswith(b"/>") else len(tag) - 1
+    return tag[:end].rstrip() + b" " + new + tag[end:]
+
+def serialize_tree(tree):
+    if HAVE_LXML:
+        return ET.tostring(tree, encoding="utf-8", xml_declaration=True, method="xml")
+    return ET.tostring(tree.getroot(), encoding="utf-8", xml_declaration=True, method="xml")
+
+IO_URING_DEPTH = 64
+IO_URING_MAX_BATCH = 4096
+
+def _open_ring(lu, count):
+    """Set up a ring sized for `count` requests, or return None if io_uring cannot be used."""
+    try:
+        ring = lu.Ring()
+        lu.io_uring_queue_init(max(IO_URING_DEPTH, min(count, IO_URING_MAX_BATCH)), ring, 0)
+    except Exception as e:  # io_uring disabled in this kernel / container, or a liburing with a different API
+        print(f"[WARN] io_uring unavailable ({e!r}), using pread/pwrite", file=sys.stderr)
+        return None
+    return ring
+
+@lru_cache(maxsize=None)  # warn only once when it is missing
+def _import_liburing():
+    try:
+        import liburing
+        return liburing
+    except ImportError:
+        print("[WARN] liburing not installed (pip install liburing), using pread/pwrite", file=sys.stderr)
+        return None
+
+def read_inputs(paths, jobs=8):
+    """
+    Read all input files up front; returns a list of bytes (None where reading failed).
+    One io_uring submission per batch when available, otherwise a thread pool of reads.
+    """
+    lu = _import_liburing()
+    ring = _open_ring(lu, len(paths)) if lu else None
+    if ring is not None:
+        try:
+            return _read_inputs_io_uring(lu, ring, paths)
+        except Exception as e:  # anything going wrong on the ring: read everything again the plain way
+            print(f"[WARN] io_uring read failed ({e!r}), using pread/pwrite", file=sys.stderr)
+
+    def read(path):
+        try:
+            return Path(path).read_bytes()
+        except OSError:
+            return None
+    with ThreadPoolExecutor(max_workers=jobs) as ex:
+        return list(ex.map(read, paths))
+
+def _pread_all(fd, buf, offset=0):
+    view = memoryview(buf)
+    while offset < len(view):
+        n = os.preadv(fd, [view[offset:]], offset)
+        if n == 0:
+            break  # file shrank underneath us
+        offset += n
+    return offset
+
+def _read_inputs_io_uring(lu, ring, paths):
+    results = [None] * len(paths)
+    open_fds = set()  # closed in the finally below if the ring fails part-way through a batch
+    try:
+        cqe = lu.Cqe()
+        for start in range(0, len(paths), IO_URING_MAX_BATCH):
+            # `batch` keeps every buffer alive until its completion has been reaped
+            batch = []
+            for i in range(start, min(start + IO_URING_MAX_BATCH, len(paths))):
+                try:
+                    fd = os.open(paths[i], os.O_RDONLY)
+                except OSError:
+                    continue
+                open_fds.add(fd)
+                buf = bytearray(os.fstat(fd).st_size)
+                sqe = lu.io_uring_get_sqe(ring)
+                lu.io_uring_prep_read(sqe, fd, buf, 0)
+                lu.io_uring_sqe_set_data64(sqe, len(batch))
+                batch.append((i, fd, buf))
+            lu.io_uring_submit(ring)
+            for _ in batch:
+                lu.trap_error(lu.io_uring_wait_cqe(ring, cqe))
+                entry = cqe[0]
+                i, fd, buf = batch[lu.io_uring_cqe_get_data64(entry)]
+                res = entry.res
+                lu.io_uring_cqe_seen(ring, entry)
+                try:
+                    if res >= 0:
+                        n = _pread_all(fd, buf, res) if res < len(buf) else res  # finish a short read
+                        results[i] = bytes(buf[:n])
+                except OSError:
+                    pass
+                finally:
+                    open_fds.discard(fd)
+                    os.close(fd)
+    finally:
+        for fd in open_fds:
+            os.close(fd)
+        lu.io_uring_queue_exit(ring)
+    return results
+
+def write_outputs(pending):
+    """
+    Write [(out_path, data), ...] and return {out_path: error message} for failed writes.
+    Uses one io_uring submission per batch when liburing is installed, os.pwrite otherwise.
+    """
+    lu = _import_liburing()
+    ring = _open_ring(lu, len(pending)) if lu else None
+    if ring is not None:
+        try:
+            return _write_outputs_io_uring(lu, ring, pending)
+        except Exception as e:  # outputs are opened with O_TRUNC, so rewriting all of them is safe
+            print(f"[WARN] io_uring write failed ({e!r}), using pread/pwrite", file=sys.stderr)
+    return _write_outputs_pwrite(pending)
+
+def _pwrite_all(fd, data, offset=0):
+    view = memoryview(data)
+    while offset < len(view):
+        offset += os.pwrite(fd, view[offset:], offset)
+
+def _write_outputs_pwrite(pending):
+    errors = {}
+    for out_path, data in pending:
+        try:
+            fd = os.open(out_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                _pwrite_all(fd, data)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            errors[out_path] = str(e)
+    return errors
+
+def _write_outputs_io_uring(lu, ring, pending):
+    errors = {}
+    open_fds = set()  # closed in the finally below if the ring fails part-way through a batch
+    try:
+        cqe = lu.Cqe()
+        for start in range(0, len(pending), IO_URING_MAX_BATCH):
+            # `batch` keeps every buffer alive until its completion has been reaped
+            batch = []
+            for out_path, data in pending[start:start + IO_URING_MAX_BATCH]:
+                try:
+                    fd = os.open(out_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                except OSError as e:
+                    errors[out_path] = str(e)
+                    continue
+                open_fds.add(fd)
+                sqe = lu.io_uring_get_sqe(ring)
+                lu.io_uring_prep_write(sqe, fd, data, 0)
+                lu.io_uring_sqe_set_data64(sqe, len(batch))
+                batch.append((out_path, fd, data))
+            lu.io_uring_submit(ring)
+            for _ in batch:
+                lu.trap_error(lu.io_uring_wait_cqe(ring, cqe))
+                entry = cqe[0]
+                out_path, fd, data = batch[lu.io_uring_cqe_get_data64(entry)]
+                res = entry.res
+                lu.io_uring_cqe_seen(ring, entry)
+                try:
+                    if res < 0:
+                        errors[out_path] = os.strerror(-res)
+                    elif res < len(data):
+                        _pwrite_all(fd, data, res)  # finish a short write synchronously
+                except OSError as e:
+                    errors[out_path] = str(e)
+                finally:
+                    open_fds.discard(fd)
+                    os.close(fd)
+    finally:
+        for fd in open_fds:
+            os.close(fd)
+        lu.io_uring_queue_exit(ring)
+    return errors
 
 def out_name_for(src, outdir):
     # Same base name, enforced .svg extension
-    return (Path(outdir) / (src.stem + ".svg")).resolve()
+    return Path(outdir) / (src.stem + ".svg")
 
 # ---------- methods ----------
 
-def method_aspect(tree, mode):
-    root = tree.getroot()
+def aspect_attrs(attrib, mode):
+    """Root attributes to set for the aspect-* methods, in the order they are applied."""
+    attrs = {}
     # keep existing viewBox if present; otherwise try to synthesize one from width/height
-    vb = get_viewbox_dims(root)
+    vb = viewbox_from_attrib(attrib)
     if not vb:
-        width = root.attrib.get("width")
-        height = root.attrib.get("height")
+        width = attrib.get("width")
+        height = attrib.get("height")
         # try to coerce numeric part
         def to_num(x):
             if x is None:
@@ -100,20 +325,46 @@ def method_aspect(tree, mode):
         w = to_num(width)
         h = to_num(height)
         if w is not None and h is not None:
-            root.set("viewBox", f"0 0 {w} {h}")
+            attrs["viewBox"] = f"0 0 {w} {h}"
             vb = (0.0, 0.0, w, h)
         else:
             # last resort
-            root.set("viewBox", "0 0 100 100")
+            attrs["viewBox"] = "0 0 100 100"
             vb = (0.0, 0.0, 100.0, 100.0)
-    root.set("preserveAspectRatio", mode)
+    attrs["preserveAspectRatio"] = mode
     # set explicit width/height to viewBox size (in px) for consistent embedding
     _, _, vbw, vbh = vb
-    root.set("width", f"{vbw}px")
-    root.set("height", f"{vbh}px")
+    attrs["width"] = f"{vbw}px"
+    attrs["height"] = f"{vbh}px"
+    return attrs
+
+def method_aspect(tree, mode):
+    root = tree.getroot()
+    for name, value in aspect_attrs(root.attrib, mode).items():
+        root.set(name, value)
     return tree
 
-def method_svgelements(path, padding=0.0, keep_size=False):
+def method_aspect_stream(path, mode, data=None):
+    """
+    aspect-* without a full DOM: read only the root attributes, then splice the new
+    values into the raw opening <svg> tag and copy the rest of the file verbatim.
+    Returns the fixed file contents, or None if the file could not be handled this way
+    (caller falls back to the DOM).
+    """
+    attrib = read_root_attrib(path, data)
+    if attrib is None:
+        return None
+    raw = data if data is not None else Path(path).read_bytes()
+    # the tag must be the root element itself, not an "<svg" inside a comment, PI or DOCTYPE
+    m = SVG_OPEN_TAG_RE.match(raw, XML_PROLOG_RE.match(raw).end())
+    if not m:
+        return None
+    tag = m.group(0)
+    for name, value in aspect_attrs(attrib, mode).items():
+        tag = set_tag_attr(tag, name, value)
+    return raw[:m.start()] + tag + raw[m.end():]
+
+def method_svgelements(path, padding=0.0, keep_size=False, data=None):
     try:
         from svgelements import SVG
     except Exception as e:
@@ -122,27 +373,10 @@ def method_svgelements(path, padding=0.0, keep_size=False):
         raise
 
     # Parse with svgelements to compute bbox (handles transforms)
-    svg = SVG.parse(str(path))
+    svg = SVG.parse(xml_source(path, data))
+    # union of element bboxes as an (xmin, ymin, xmax, ymax) accumulator
     bbox = None
 
-    def union(bb, other):
-        if bb is None:
-            return other
-        if other is None:
-            return bb
-        x0 = min(bb.x, other.x)
-        y0 = min(bb.y, other.y)
-        x1 = max(bb.x + bb.width, other.x + other.width)
-        y1 = max(bb.y + bb.height, other.y + other.height)
-        class BB:
-            pass
-        res = BB()
-        res.x = x0
-        res.y = y0
-        res.width = x1 - x0
-        res.height = y1 - y0
-        return res
-
     # iterate all elements and union their bboxes
     for e in svg.elements():
         try:
@@ -151,24 +385,27 @@ def method_svgelements(path, padding=0.0, keep_size=False):
         except Exception:
             pass
         try:
-            bb = e.bbox()
+            bb = e.bbox()  # (xmin, ymin, xmax, ymax) or None
         except Exception:
             bb = None
         if bb is None:
             continue
-        bbox = union(bbox, bb)
+        if bbox is None:
+            bbox = bb
+        else:
+            bbox = (min(bbox[0], bb[0]), min(bbox[1], bb[1]), max(bbox[2], bb[2]), max(bbox[3], bb[3]))
 
     if bbox is None:
         raise RuntimeError("Could not compute geometry bbox; is the SVG empty or purely text?")
 
     # Apply padding
-    x = bbox.x - padding
-    y = bbox.y - padding
-    w = bbox.width + 2 * padding
-    h = bbox.height + 2 * padding
+    x = bbox[0] - padding
+    y = bbox[1] - padding
+    w = (bbox[2] - bbox[0]) + 2 * padding
+    h = (bbox[3] - bbox[1]) + 2 * padding
 
     # Load the XML to set viewBox and size
-    tree = ET.parse(str(path))
+    tree = parse_xml(path, data)
     root = tree.getroot()
 
     if not keep_size:
@@ -178,17 +415,19 @@ def method_svgelements(path, padding=0.0, keep_size=False):
     root.set("viewBox", f"{x} {y} {w} {h}")
     return tree
 
-def method_inkscape(in_path, out_path):
+def inkscape_cmd(in_path, out_path):
     # Inkscape >=1.0 CLI
-    cmd = [
+    return [
         "inkscape",
         "--export-area-drawing",
         "--export-type=svg",
         f"--export-filename={str(out_path)}",
         str(in_path),
     ]
+
+def method_inkscape(in_path, out_path):
     try:
-        subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        subprocess.run(inkscape_cmd(in_path, out_path), check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         return True
     except FileNotFoundError:
         print("[ERROR] Inkscape not found in PATH. Install it or use --method svgelements.", file=sys.stderr)
@@ -197,6 +436,155 @@ def method_inkscape(in_path, out_path):
         print(f"[ERROR] Inkscape failed on {in_path}:\n{e.stderr.decode('utf-8', 'ignore')}", file=sys.stderr)
         return False
 
+async def _inkscape_once(in_path, out_path, sem):
+    async with sem:
+        try:
+            proc = await asyncio.create_subprocess_exec(*inkscape_cmd(in_path, out_path),
+                                                        stdout=asyncio.subprocess.PIPE,
+                                                        stderr=asyncio.subprocess.PIPE)
+        except FileNotFoundError:
+            print("[ERROR] Inkscape not found in PATH. Install it or use --method svgelements.", file=sys.stderr)
+            return False
+        _, err = await proc.communicate()
+    if proc.returncode != 0:
+        print(f"[ERROR] Inkscape failed on {in_path}:\n{err.decode('utf-8', 'ignore')}", file=sys.stderr)
+        return False
+    return True
+
+def method_inkscape_many(pairs, jobs):
+    """
+    One-shot Inkscape CLI for every (in_path, out_path) pair, with at most `jobs`
+    processes running at once. Returns a list of per-pair success flags.
+    """
+    async def gather():
+        sem = asyncio.Semaphore(jobs)
+        return await asyncio.gather(*(_inkscape_once(i, o, sem) for i, o in pairs))
+    return list(asyncio.run(gather()))
+
+INKSCAPE_PROMPT = "> "
+
+def _read_until_prompt(stream):
+    # Inkscape's shell prints "> " (no newline) once it is ready for the next command
+    buf = []
+    while True:
+        ch = stream.read(1)
+        if not ch:
+            return False  # EOF: shell died
+        buf.append(ch)
+        if len(buf) >= 2 and buf[-2] + buf[-1] == INKSCAPE_PROMPT:
+            return True
+
+def method_inkscape_shell(pairs):
+    """
+    Export all (in_path, out_path) pairs through a single `inkscape --shell` process,
+    paying Inkscape's startup cost once instead of per file.
+    Returns a list of per-pair success flags, or None if Inkscape could not be started.
+    Pairs the shell could not handle get None as their flag and are left to the one-shot CLI.
+    """
+    try:
+        proc = subprocess.Popen(["inkscape", "--shell"], stdin=subprocess.PIPE,
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    except FileNotFoundError:
+        print("[ERROR] Inkscape not found in PATH. Install it or use --method svgelements.", file=sys.stderr)
+        return None
+
+    results = []
+    try:
+        alive = _read_until_prompt(proc.stdout)
+        for in_path, out_path in pairs:
+            # ';' separates actions in shell mode, such paths go through the one-shot CLI
+            if not alive or ";" in str(in_path) or ";" in str(out_path):
+                results.append(None)
+                continue
+            # remove stale output so success can be judged by the file appearing
+            Path(out_path).unlink(missing_ok=True)
+            proc.stdin.write(
+                f"file-open:{in_path}; export-area-drawing; export-type:svg; "
+                f"export-filename:{out_path}; export-do; file-close\n"
+            )
+            proc.stdin.flush()
+            alive = _read_until_prompt(proc.stdout)
+            ok = Path(out_path).exists()
+            if not ok:
+                print(f"[ERROR] Inkscape failed on {in_path}", file=sys.stderr)
+            results.append(ok)
+        if alive:
+            proc.stdin.write("quit\n")
+            proc.stdin.flush()
+    finally:
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+    return results
+
+def process_one(src, src_data=None, *, outdir, method, padding=0.0, keep_size=False, defer_write=False):
+    """
+    Fix a single SVG. Returns (src, out_path, ok, error message or None, data).
+    src_data: the input file's bytes if already read, otherwise it is read from `src`.
+    It is the second positional parameter so a partial() over the keyword options can be mapped over (svgs, inputs).
+    With defer_write the output is not written; its bytes are returned as `data` instead.
+    """
+    out_path = out_name_for(src, outdir)  # same base name, forced .svg
+
+    if method == "inkscape":
+        return src, out_path, method_inkscape(src, out_path), None, None
+    if method == "svgelements":
+        try:
+            data = serialize_tree(method_svgelements(src, padding=padding, keep_size=keep_size, data=src_data))
+        except Exception as e:
+            return src, out_path, False, str(e), None
+    elif method in ("aspect-slice", "aspect-none"):
+        mode = "xMidYMid slice" if method == "aspect-slice" else "none"
+        data = method_aspect_stream(src, mode, src_data)
+        if data is None:
+            tree = load_xml(src, src_data)
+            if tree is None:
+                return src, out_path, False, None, None  # already warned by load_xml
+            data = serialize_tree(method_aspect(tree, mode))
+    else:
+        return src, out_path, False, f"Unknown method {method}", None
+
+    if defer_write:
+        return src, out_path, True, None, data
+    try:
+        Path(out_path).write_bytes(data)
+    except OSError as e:
+        return src, out_path, False, str(e), None
+    return src, out_path, True, None, None
+
+def run_inkscape(svgs, outdir, jobs):
+    """
+    Inkscape is an external process, so threads are enough to keep several of them busy.
+    Each worker drives its own `inkscape --shell` over an interleaved share of the files.
+    """
+    pairs = [(src, out_name_for(src, outdir)) for src in svgs]
+    if len(pairs) == 1:
+        src, out_path = pairs[0]
+        return [(src, out_path, method_inkscape(src, out_path), None, None)]
+    if shutil.which("inkscape") is None:
+        print("[ERROR] Inkscape not found in PATH. Install it or use --method svgelements.", file=sys.stderr)
+        return [(src, out_path, False, None, None) for src, out_path in pairs]
+
+    shards = [pairs[i::jobs] for i in range(min(jobs, len(pairs)))]
+    with ThreadPoolExecutor(max_workers=len(shards)) as ex:
+        shard_results = list(ex.map(method_inkscape_shell, shards))
+
+    ok_by_src = {}
+    for shard, results in zip(shards, shard_results):
+        if results is None:
+            results = [False] * len(shard)
+        for (src, _), ok in zip(shard, results):
+            ok_by_src[src] = ok
+
+    # whatever a shell skipped (it died, or the path had a ';') runs as concurrent one-shot exports
+    leftover = [(src, out_path) for src, out_path in pairs if ok_by_src[src] is None]
+    if leftover:
+        for (src, _), ok in zip(leftover, method_inkscape_many(leftover, jobs)):
+            ok_by_src[src] = ok
+    return [(src, out_path, ok_by_src[src], None, None) for src, out_path in pairs]
+
 # ---------- main ----------
 
 def main():
@@ -207,6 +595,11 @@ def main():
                     default="inkscape", help="How to fix margins (default: inkscape)")
     ap.add_argument("--padding", type=float, default=0.0, help="Extra padding around tight bbox (svgelements only)")
     ap.add_argument("--keep-size", action="store_true", help="Keep original width/height (svgelements only)")
+    ap.add_argument("-j", "--jobs", type=int, default=None,
+                    help="Parallel workers (default: CPU count, at most 8 for inkscape; 1 = serial)")
+    ap.add_argument("--io-uring", action="store_true",
+                    help="Read all inputs and write all outputs in batched io_uring submissions "
+                         "(Linux, pip install liburing; not used by inkscape, which does its own I/O)")
     args = ap.parse_args()
 
     svgs = find_svgs(args.inputs)
@@ -214,38 +607,45 @@ def main():
         print("No SVGs found.", file=sys.stderr)
         sys.exit(1)
 
-    outdir = Path(args.outdir)
+    # resolve once here instead of per output path in out_name_for
+    outdir = Path(args.outdir).resolve()
     ensure_outdir(outdir)
 
+    cpus = os.cpu_count() or 1
+    if args.method == "inkscape":
+        jobs = max(1, args.jobs or min(8, cpus))
+        results = run_inkscape(svgs, outdir, jobs)
+    else:
+        jobs = max(1, args.jobs or cpus)
+        worker = partial(process_one, outdir=outdir, method=args.method,
+                         padding=args.padding, keep_size=args.keep_size, defer_write=args.io_uring)
+        # with --io-uring all inputs are read in one batch before any parsing starts
+        inputs = read_inputs(svgs, jobs) if args.io_uring else [None] * len(svgs)
+        if jobs == 1 or len(svgs) == 1:
+            results = [worker(src, data) for src, data in zip(svgs, inputs)]
+        else:
+            # svgelements / aspect-* are CPU-bound Python: use processes, not threads
+            with ProcessPoolExecutor(max_workers=min(jobs, len(svgs))) as ex:
+                results = list(ex.map(worker, svgs, inputs, chunksize=4))
+        if args.io_uring:
+            # CPU phase done: now write every output in one batch
+            write_errors = write_outputs([(r[1], r[4]) for r in results if r[2]])
+            results = [
+                (src, out_path, False, f"write failed: {write_errors[out_path]}", None)
+                if out_path in write_errors else (src, out_path, ok, err, data)
+                for src, out_path, ok, err, data in results
+            ]
+
+    # report from the main process so lines from different workers don't interleave
     count_ok = 0
-    for src in svgs:
-        out_path = out_name_for(src, outdir)  # same base name, forced .svg
-
-        if args.method == "inkscape":
-            if method_inkscape(src, out_path):
-                count_ok += 1
-                print(f"[OK] {src} -> {out_path} (inkscape)")
-        elif args.method == "svgelements":
-            try:
-                tree = method_svgelements(src, padding=args.padding, keep_size=args.keep_size)
-                write_tree(tree, out_path)
-                count_ok += 1
-                print(f"[OK] {src} -> {out_path} (svgelements)")
-            except Exception as e:
-                print(f"[FAIL] {src}: {e}", file=sys.stderr)
-        elif args.method in ("aspect-slice", "aspect-none"):
-            tree = load_xml(src)
-            if tree is None:
-                continue
-            mode = "xMidYMid slice" if args.method == "aspect-slice" else "none"
-            tree = method_aspect(tree, mode)
-            write_tree(tree, out_path)
+    for src, out_path, ok, err, _ in results:
+        if ok:
             count_ok += 1
             print(f"[OK] {src} -> {out_path} ({args.method})")
-        else:
-            print(f"[ERROR] Unknown method {args.method}", file=sys.stderr)
+        elif err:
+            print(f"[FAIL] {src}: {err}", file=sys.stderr)
 
-    print(f"Done. {count_ok}/{len(svgs)} files processed OK. Output in: {outdir.resolve()}")
+    print(f"Done. {count_ok}/{len(svgs)} files processed OK. Output in: {outdir}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
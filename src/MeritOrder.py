@@ -20,6 +20,29 @@ class Power(Enum):
 		return f"Power.{self.name}"
 
 class MeritOrder:
+	# Constant per-source tables, shared by all instances instead of being rebuilt in __init__
+	co2eq = {
+		Power.COAL: 1,
+		Power.GAS: 0.5,
+		Power.NUCLEAR: 0,
+		Power.WATER: 0,
+		Power.WATER_STORAGE: 0,
+		Power.WIND: 0,
+		Power.PHOTOVOLTAIC: 0,
+		Power.BATTERY: 0,
+	}
+
+	derating = {
+		Power.COAL: 87.9,
+		Power.GAS: 95,
+		Power.NUCLEAR: 92.1,
+		Power.WATER: 41,
+		Power.WATER_STORAGE: 41,
+		Power.WIND: 7.3,
+		Power.PHOTOVOLTAIC: 2.7,
+		Power.BATTERY: 0.0,
+	}
+
 	def __init__(self, prices: dict[Power, float], productions: List[Tuple[Power, float]], total_consumption: float):
 		self.prices = prices
 		
@@ -36,27 +59,6 @@ class MeritOrder:
 			self.sorted_productions = np.array([]).reshape(0, 2)
 			
 		self.total_consumption = total_consumption
-		self.co2eq = {
-			Power.COAL: 1,
-			Power.GAS: 0.5,
-			Power.NUCLEAR: 0,
-			Power.WATER: 0,
-			Power.WATER_STORAGE: 0,
-			Power.WIND: 0,
-			Power.PHOTOVOLTAIC: 0,
-			Power.BATTERY: 0,
-		}
-
-		self.derating = {
-			Power.COAL: 87.9,
-			Power.GAS: 95,
-			Power.NUCLEAR: 92.1,
-			Power.WATER: 41,
-			Power.WATER_STORAGE: 41,
-			Power.WIND: 7.3,
-			Power.PHOTOVOLTAIC: 2.7,
-			Power.BATTERY: 0.0,
-		}
 
 	def getPrice(self):
 		'''Get the current price of power in EUR/MWh, by ordering the powerplant according to the merit order, and getting the lowest price that satisfies the total consumption.'''
@@ -5,8 +5,8 @@ Optimized binary data format for efficient communication with ESP32 boards
 """
 
 import struct
-from typing import Tuple, Dict, List, Any, Optional
-from enum import IntEnum
+from operator import attrgetter
+from typing import Tuple, Dict, List, Any, Optional, Callable
 
 # Protocol constants
 MAX_BOARD_NAME_LENGTH = 32
@@ -14,6 +14,86 @@ MAX_BOARD_TYPE_LENGTH = 16
 MAX_STRING_LENGTH = 64
 MAX_BUILDING_TABLE_ENTRIES = 64
 
+# Precompiled struct formats (avoids re-parsing the format string on every call)
+_U8 = struct.Struct('B')
+_U32 = struct.Struct('>I')
+_I32 = struct.Struct('>i')
+_F32 = struct.Struct('>f')
+_ID_I32 = struct.Struct('>Bi')       # id(1) + value(4)
+_ID_I32_I32 = struct.Struct('>Bii')  # id(1) + min(4) + max(4)
+_POWER_VALUES = struct.Struct('>ii')  # production(4) + consumption(4)
+_POWER_VALUES_NO_BUILDINGS = struct.Struct('>iiB')  # production(4) + consumption(4) + buildings_count(1) = 0
+_GAME_STATUS_HDR = struct.Struct('>HH')
+# board_id(4) + board_name(32) + board_type(16) = 52 bytes; 's' fields are null-padded by struct
+_REGISTRATION_REQUEST = struct.Struct(f'>I{MAX_BOARD_NAME_LENGTH}s{MAX_BOARD_TYPE_LENGTH}s')
+
+_enum_value = attrgetter('value')
+
+def _id_getter(mapping: Dict) -> Callable[[Any], int]:
+    """
+    Pick the key -> numeric id conversion once per dict instead of probing every key.
+    Keys are homogeneous: either all enum members or all plain ints.
+    """
+    for key in mapping:
+        return _enum_value if hasattr(key, 'value') else int
+    return int
+
+def _encode_buildings(connected_buildings: Optional[List[Dict[str, Any]]]) -> List[Tuple[bytes, int]]:
+    """Encode connected buildings to (uid_bytes, building_type) pairs ahead of packing"""
+    if not connected_buildings:
+        return []
+    return [(building.get('uid', '').encode('utf-8')[:255],  # Limit UID length
+             building.get('building_type', 0))
+            for building in connected_buildings]
+
+def _buildings_size(buildings: List[Tuple[bytes, int]]) -> int:
+    """Packed size of buildings_count(1) + [uid_len(1) + uid + building_type(1)]*"""
+    return 1 + sum(2 + len(uid_bytes) for uid_bytes, _ in buildings)
+
+def _pack_entries(entry: struct.Struct, rows: List[Tuple]) -> bytes:
+    """
+    Pack count(1) + rows packed with `entry`.
+    bytes.join sizes the output once from the pieces; for every table size the 1-byte count allows
+    this measured faster than both pack_into over a pre-sized bytearray and a NumPy structured array.
+    """
+    pack = entry.pack
+    return b''.join([_U8.pack(len(rows))] + [pack(*row) for row in rows])
+
+def _pack_buildings_into(buf: bytearray, offset: int, buildings: List[Tuple[bytes, int]]) -> int:
+    """Write buildings_count(1) + [uid_len(1) + uid + building_type(1)]* into buf, return the new offset"""
+    _U8.pack_into(buf, offset, len(buildings))
+    offset += 1
+    for uid_bytes, building_type in buildings:
+        uid_len = len(uid_bytes)
+        buf[offset] = uid_len
+        buf[offset + 1:offset + 1 + uid_len] = uid_bytes
+        offset += 1 + uid_len
+        _U8.pack_into(buf, offset, building_type)
+        offset += 1
+    return offset
+
+def _unpack_buildings_from(data: bytes, offset: int, truncated_error: str) -> List[Dict[str, Any]]:
+    """Read buildings_count(1) + [uid_len(1) + uid + building_type(1)]* starting at offset"""
+    size = len(data)
+    if offset >= size:
+        raise BinaryProtocolError(truncated_error)
+    buildings_count = data[offset]
+    offset += 1
+    
+    connected_buildings = []
+    append = connected_buildings.append
+    for _ in range(buildings_count):
+        if offset + 1 > size:
+            raise BinaryProtocolError(truncated_error)
+        uid_end = offset + 1 + data[offset]
+        if uid_end + 1 > size:
+            raise BinaryProtocolError("Invalid building UID data")
+        append({'uid': data[offset + 1:uid_end].decode('utf-8', errors='ignore'),
+                'building_type': data[uid_end]})
+        offset = uid_end + 1
+    
+    return connected_buildings
+
 class BinaryProtocolError(Exception):
     """Custom exception for binary protocol errors"""
     pass
@@ -26,14 +106,18 @@ class BoardBinaryProtocol:
     
     @staticmethod
     def pack_string(text: str, max_length: int) -> bytes:
-        """Pack a string into a fixed-length byte array with null padding"""
-        encoded = text.encode('utf-8')[:max_length]
-        return encoded.ljust(max_length, b'\x00')
+        """
+        Pack a string into a fixed-length byte array with null padding
+        Legacy helper - fixed-width fields inside a message should use an 'Ns' field of that message's Struct
+        """
+        # 'Ns' truncates and null-pads in one step
+        return struct.pack(f'{max_length}s', text.encode('utf-8'))
     
     @staticmethod
     def unpack_string(data: bytes) -> str:
         """Unpack a null-terminated string from bytes"""
-        return data.rstrip(b'\x00').decode('utf-8', errors='ignore')
+        # split with maxsplit=1 stops at the first terminator; measured faster than find + slice
+        return data.split(b'\x00', 1)[0].decode('utf-8', errors='ignore')
     
     @staticmethod
     def pack_registration_request(board_id: int, board_name: str, board_type: str) -> bytes:
@@ -41,10 +125,11 @@ class BoardBinaryProtocol:
         Pack board registration request
         Format: board_id(4) + board_name(32) + board_type(16) = 52 bytes
         """
-        data = struct.pack('>I', board_id)
-        data += BoardBinaryProtocol.pack_string(board_name, MAX_BOARD_NAME_LENGTH)
-        data += BoardBinaryProtocol.pack_string(board_type, MAX_BOARD_TYPE_LENGTH)
-        return data
+        return _REGISTRATION_REQUEST.pack(
+            board_id,
+            board_name.encode('utf-8')[:MAX_BOARD_NAME_LENGTH],
+            board_type.encode('utf-8')[:MAX_BOARD_TYPE_LENGTH]
+        )
     
     @staticmethod
     def unpack_registration_request(data: bytes) -> Tuple[int, str, str]:
@@ -53,12 +138,14 @@ class BoardBinaryProtocol:
         Format: board_id(4) + board_name(32) + board_type(16) = 52 bytes
         Returns: (board_id, board_name, board_type)
         """
-        if len(data) < 52:
-            raise BinaryProtocolError(f"Invalid registration data length: {len(data)}, expected at least 52 bytes")
+        if len(data) < _REGISTRATION_REQUEST.size:
+            raise BinaryProtocolError(f"Invalid registration data length: {len(data)}, expected at least {_REGISTRATION_REQUEST.size} bytes")
         
-        board_id = struct.unpack('>I', data[0:4])[0]
+        board_id, name_raw, type_raw = _REGISTRATION_REQUEST.unpack_from(data, 0)
         
-        return board_id
+        return (board_id,
+                BoardBinaryProtocol.unpack_string(name_raw),
+                BoardBinaryProtocol.unpack_string(type_raw))
     
     @staticmethod
     def pack_registration_response(success: bool, message: str) -> bytes:
@@ -66,11 +153,14 @@ class BoardBinaryProtocol:
         Pack registration response
         Format: success(1) + message_len(1) + message
         """
-        success_byte = b'\x01' if success else b'\x00'
         message_bytes = message.encode('utf-8')[:255]
         message_len = len(message_bytes)
         
-        return success_byte + struct.pack('B', message_len) + message_bytes
+        buf = bytearray(2 + message_len)
+        buf[0] = 1 if success else 0
+        buf[1] = message_len
+        buf[2:] = message_bytes
+        return bytes(buf)
     
     @staticmethod
     def unpack_registration_response(data: bytes) -> Tuple[bool, str]:
@@ -94,42 +184,45 @@ class BoardBinaryProtocol:
         Format: prod_count(1) + [source_id(1) + coeff(4)]* + cons_count(1) + [building_id(1) + consumption(4)]* + buildings_count(1) + [uid_len(1) + uid + building_type(1)]*
         Uses signed integers for production to support negative values (e.g., battery charging)
         """
-        data = b''
-        
-        # Pack production coefficients (using signed integers)
-        prod_count = len(production_coeffs)
-        data += struct.pack('B', prod_count)
-        
-        for source, coeff in production_coeffs.items():
-            source_id = source.value if hasattr(source, 'value') else int(source)
-            coeff_int = int(coeff * 1000)  # Convert to mW (signed)
-            data += struct.pack('>Bi', source_id, coeff_int)
-        
-        # Pack consumption coefficients  
-        cons_count = len(consumption_coeffs)
-        data += struct.pack('B', cons_count)
-        
-        for building, consumption in consumption_coeffs.items():
-            building_id = building.value if hasattr(building, 'value') else int(building)
-            cons_int = int(consumption * 1000) if consumption else 0  # Convert to mW
-            data += struct.pack('>Bi', building_id, cons_int)
-        
-        # Pack connected buildings
-        if connected_buildings is None:
-            connected_buildings = []
-        buildings_count = len(connected_buildings)
-        data += struct.pack('B', buildings_count)
-        
-        for building in connected_buildings:
-            uid = building.get('uid', '')
-            building_type = building.get('building_type', 0)
-            uid_bytes = uid.encode('utf-8')[:255]  # Limit UID length
-            uid_len = len(uid_bytes)
-            data += struct.pack('B', uid_len)
-            data += uid_bytes
-            data += struct.pack('B', building_type)
-        
-        return data
+        return BoardBinaryProtocol.pack_coefficients_with_prefix(
+            BoardBinaryProtocol.pack_coefficients_prefix(production_coeffs, consumption_coeffs),
+            connected_buildings
+        )
+    
+    @staticmethod
+    def pack_coefficients_prefix(production_coeffs: Dict, consumption_coeffs: Dict) -> bytes:
+        """
+        Pack the production and consumption sections of a coefficients response (everything before
+        the buildings). They are the same for every board in a round, so callers can pack them once
+        and finish each board's frame with pack_coefficients_with_prefix().
+        """
+        # Production coefficients (using signed integers, converted to mW)
+        to_id = _id_getter(production_coeffs)
+        prod_rows = [
+            (to_id(source), int(coeff * 1000))
+            for source, coeff in production_coeffs.items()
+        ]
+        # Consumption coefficients (mW)
+        to_id = _id_getter(consumption_coeffs)
+        cons_rows = [
+            (to_id(building),
+             int(consumption * 1000) if consumption else 0)
+            for building, consumption in consumption_coeffs.items()
+        ]
+        
+        return _pack_entries(_ID_I32, prod_rows) + _pack_entries(_ID_I32, cons_rows)
+    
+    @staticmethod
+    def pack_coefficients_with_prefix(prefix: bytes, connected_buildings: List[Dict[str, Any]] = None) -> bytes:
+        """
+        Complete a coefficients response from a pack_coefficients_prefix() result and a board's connected buildings
+        """
+        buildings = _encode_buildings(connected_buildings)
+        buf = bytearray(len(prefix) + _buildings_size(buildings))
+        buf[:len(prefix)] = prefix
+        _pack_buildings_into(buf, len(prefix), buildings)
+        
+        return bytes(buf)
     
     @staticmethod
     def unpack_coefficients_response(data: bytes) -> Tuple[Dict, Dict, List[Dict[str, Any]]]:
@@ -137,59 +230,29 @@ class BoardBinaryProtocol:
         Unpack production and consumption coefficients, and connected buildings
         Returns: (prod_coeffs, cons_coeffs, connected_buildings)
         """
-        if len(data) < 2:
+        if len(data) < 3:  # prod_count + cons_count + buildings_count
             raise BinaryProtocolError("Invalid coefficients data")
         
-        offset = 0
-        
-        # Unpack production coefficients
-        prod_count = data[offset]
-        offset += 1
+        view = memoryview(data)
         
-        prod_coeffs = {}
-        for i in range(prod_count):
-            if offset + 5 > len(data):
-                raise BinaryProtocolError("Invalid production coefficient data")
-            source_id = data[offset]
-            coeff_int = struct.unpack('>i', data[offset+1:offset+5])[0]
-            coeff = coeff_int / 1000.0
-            prod_coeffs[source_id] = coeff
-            offset += 5
-        
-        # Unpack consumption coefficients
-        cons_count = data[offset]
-        offset += 1
+        # Unpack production coefficients (mW -> W)
+        end = 1 + data[0] * _ID_I32.size
+        if end >= len(data):  # the consumption count byte must follow
+            raise BinaryProtocolError("Invalid production coefficient data")
+        prod_coeffs = {source_id: coeff_int / 1000.0
+                       for source_id, coeff_int in _ID_I32.iter_unpack(view[1:end])}
+        offset = end
         
-        cons_coeffs = {}
-        for i in range(cons_count):
-            if offset + 5 > len(data):
-                raise BinaryProtocolError("Invalid consumption coefficient data")
-            building_id = data[offset]
-            cons_int = struct.unpack('>i', data[offset+1:offset+5])[0]
-            cons = cons_int / 1000.0
-            cons_coeffs[building_id] = cons
-            offset += 5
+        # Unpack consumption coefficients (mW -> W)
+        end = offset + 1 + data[offset] * _ID_I32.size
+        if end > len(data):
+            raise BinaryProtocolError("Invalid consumption coefficient data")
+        cons_coeffs = {building_id: cons_int / 1000.0
+                       for building_id, cons_int in _ID_I32.iter_unpack(view[offset + 1:end])}
+        offset = end
         
         # Unpack connected buildings
-        buildings_count = data[offset]
-        offset += 1
-        
-        connected_buildings = []
-        for i in range(buildings_count):
-            if offset + 1 > len(data):
-                raise BinaryProtocolError("Invalid connected buildings data")
-            uid_len = data[offset]
-            offset += 1
-            
-            if offset + uid_len + 1 > len(data):
-                raise BinaryProtocolError("Invalid building UID data")
-            uid = data[offset:offset+uid_len].decode('utf-8', errors='ignore')
-            offset += uid_len
-            
-            building_type = data[offset]
-            offset += 1
-            
-            connected_buildings.append({'uid': uid, 'building_type': building_type})
+        connected_buildings = _unpack_buildings_from(data, offset, "Invalid connected buildings data")
         
         return prod_coeffs, cons_coeffs, connected_buildings
     
@@ -200,16 +263,12 @@ class BoardBinaryProtocol:
         Format: count(1) + [source_id(1) + coeff(4)]*
         Uses signed integers to support negative coefficients (e.g., battery charging)
         """
-        data = b''
-        count = len(prod_coeffs)
-        data += struct.pack('B', count)
-        
-        for source, coeff in prod_coeffs.items():
-            source_id = source.value if hasattr(source, 'value') else int(source)
-            coeff_int = int(coeff * 1000)  # Convert to mW (signed)
-            data += struct.pack('>Bi', source_id, coeff_int)
-        
-        return data
+        to_id = _id_getter(prod_coeffs)
+        rows = [
+            (to_id(source), int(coeff * 1000))  # mW (signed)
+            for source, coeff in prod_coeffs.items()
+        ]
+        return _pack_entries(_ID_I32, rows)
     
     @staticmethod
     def pack_production_ranges(prod_ranges: Dict) -> bytes:
@@ -218,17 +277,13 @@ class BoardBinaryProtocol:
         Format: count(1) + [source_id(1) + min_power(4) + max_power(4)]*
         Uses signed integers to support negative values (e.g., battery charging)
         """
-        data = b''
-        count = len(prod_ranges)
-        data += struct.pack('B', count)
-        
-        for source, (min_power, max_power) in prod_ranges.items():
-            source_id = source.value if hasattr(source, 'value') else int(source)
-            min_power_mw = int(min_power * 1000)  # Convert to mW (signed)
-            max_power_mw = int(max_power * 1000)  # Convert to mW (signed)
-            data += struct.pack('>Bii', source_id, min_power_mw, max_power_mw)
-        
-        return data
+        to_id = _id_getter(prod_ranges)
+        rows = [
+            (to_id(source),
+             int(min_power * 1000), int(max_power * 1000))  # mW (signed)
+            for source, (min_power, max_power) in prod_ranges.items()
+        ]
+        return _pack_entries(_ID_I32_I32, rows)
     
     @staticmethod
     def pack_consumption_values(cons_coeffs: Dict) -> bytes:
@@ -236,16 +291,13 @@ class BoardBinaryProtocol:
         Pack consumption coefficient values
         Format: count(1) + [building_id(1) + consumption(4)]*
         """
-        data = b''
-        count = len(cons_coeffs)
-        data += struct.pack('B', count)
-        
-        for building, consumption in cons_coeffs.items():
-            building_id = building.value if hasattr(building, 'value') else int(building)
-            cons_int = int(consumption * 1000) if consumption else 0  # Convert to mW
-            data += struct.pack('>Bi', building_id, cons_int)
-        
-        return data
+        to_id = _id_getter(cons_coeffs)
+        rows = [
+            (to_id(building),
+             int(consumption * 1000) if consumption else 0)  # Convert to mW
+            for building, consumption in cons_coeffs.items()
+        ]
+        return _pack_entries(_ID_I32, rows)
     
     @staticmethod
     def unpack_power_values(data: bytes) -> Tuple[float, float]:
@@ -257,7 +309,7 @@ class BoardBinaryProtocol:
         if len(data) < 8:
             raise BinaryProtocolError(f"Invalid power data length: {len(data)}, expected 8 bytes")
         
-        prod_mw, cons_mw = struct.unpack('>ii', data[:8])
+        prod_mw, cons_mw = _POWER_VALUES.unpack_from(data, 0)
         
         # Convert from mW to W
         production = prod_mw / 1000.0
@@ -265,6 +317,44 @@ class BoardBinaryProtocol:
         
         return production, consumption
     
+    @staticmethod
+    def pack_power_values_batch(production: 'np.ndarray', consumption: 'np.ndarray') -> bytes:
+        """
+        Pack power values for many boards at once
+        Format: [production(4) + consumption(4)]* - N consecutive unpack_power_values frames
+        Values are in W and truncated to mW like the single-board path
+        """
+        import numpy as np  # only the batch helpers need numpy
+        
+        production = np.asarray(production, dtype=np.float64)
+        consumption = np.asarray(consumption, dtype=np.float64)
+        if production.shape != consumption.shape:
+            raise BinaryProtocolError(f"Mismatched power arrays: {production.shape} vs {consumption.shape}")
+        
+        frames = np.empty(production.size, dtype=[('production', '>i4'), ('consumption', '>i4')])
+        for name, values in (('production', production), ('consumption', consumption)):
+            # astype() would silently wrap NaN / out-of-range values; reject them like the scalar path does
+            mw = np.trunc(values.ravel() * 1000)
+            if not (np.isfinite(mw) & (mw >= -2**31) & (mw <= 2**31 - 1)).all():
+                raise BinaryProtocolError(f"Invalid {name} value: not a finite 32-bit mW value")
+            frames[name] = mw
+        return frames.tobytes()
+    
+    @staticmethod
+    def unpack_power_values_batch(data: bytes) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        Unpack N power value frames
+        Format: [production(4) + consumption(4)]*
+        Returns: (production_W, consumption_W) arrays
+        """
+        if len(data) % _POWER_VALUES.size:
+            raise BinaryProtocolError(f"Invalid power data length: {len(data)}, expected a multiple of {_POWER_VALUES.size} bytes")
+        
+        import numpy as np  # only the batch helpers need numpy
+        
+        frames = np.frombuffer(data, dtype='>i4').reshape(-1, 2)
+        return frames[:, 0] / 1000.0, frames[:, 1] / 1000.0
+    
     @staticmethod
     def unpack_power_data_with_buildings(data: bytes) -> Tuple[float, float, List[Dict[str, Any]]]:
         """
@@ -275,30 +365,11 @@ class BoardBinaryProtocol:
         if len(data) < 9:  # At least 8 for power + 1 for count
             raise BinaryProtocolError(f"Invalid power data length: {len(data)}, expected at least 9 bytes")
         
-        prod_mw, cons_mw = struct.unpack('>ii', data[:8])
+        prod_mw, cons_mw = _POWER_VALUES.unpack_from(data, 0)
         production = prod_mw / 1000.0
         consumption = cons_mw / 1000.0
         
-        offset = 8
-        buildings_count = data[offset]
-        offset += 1
-        
-        connected_buildings = []
-        for i in range(buildings_count):
-            if offset + 1 > len(data):
-                raise BinaryProtocolError("Invalid building data")
-            uid_len = data[offset]
-            offset += 1
-            
-            if offset + uid_len + 1 > len(data):
-                raise BinaryProtocolError("Invalid building UID data")
-            uid = data[offset:offset+uid_len].decode('utf-8', errors='ignore')
-            offset += uid_len
-            
-            building_type = data[offset]
-            offset += 1
-            
-            connected_buildings.append({'uid': uid, 'building_type': building_type})
+        connected_buildings = _unpack_buildings_from(data, _POWER_VALUES.size, "Invalid building data")
         
         return production, consumption, connected_buildings
     
@@ -308,23 +379,15 @@ class BoardBinaryProtocol:
         Pack power data with optional connected buildings for transmission
         Format: production(4) + consumption(4) + buildings_count(1) + [uid_len(1) + uid + building_type(1)]*
         """
-        data = struct.pack('>ii', int(production * 1000), int(consumption * 1000))
-        
-        if connected_buildings is None:
-            connected_buildings = []
-        buildings_count = len(connected_buildings)
-        data += struct.pack('B', buildings_count)
-        
-        for building in connected_buildings:
-            uid = building.get('uid', '')
-            building_type = building.get('building_type', 0)
-            uid_bytes = uid.encode('utf-8')[:255]  # Limit UID length
-            uid_len = len(uid_bytes)
-            data += struct.pack('B', uid_len)
-            data += uid_bytes
-            data += struct.pack('B', building_type)
-        
-        return data
+        if not connected_buildings:
+            # Fixed 9-byte frame: a single Struct call, no size computation or buffer bookkeeping
+            return _POWER_VALUES_NO_BUILDINGS.pack(int(production * 1000), int(consumption * 1000), 0)
+        
+        buildings = _encode_buildings(connected_buildings)
+        buf = bytearray(_POWER_VALUES.size + _buildings_size(buildings))
+        _POWER_VALUES.pack_into(buf, 0, int(production * 1000), int(consumption * 1000))
+        _pack_buildings_into(buf, _POWER_VALUES.size, buildings)
+        return bytes(buf)
     
     @staticmethod
     def pack_building_table(table: Dict[int, int], version: int) -> bytes:
@@ -332,13 +395,7 @@ class BoardBinaryProtocol:
         Pack building consumption table
         Format: version(4) + count(1) + [building_type(1) + consumption(4)]*
         """
-        data = struct.pack('>I', version)
-        data += struct.pack('B', len(table))
-        
-        for building_type, consumption in table.items():
-            data += struct.pack('>Bi', building_type, consumption)
-        
-        return data
+        return _U32.pack(version) + _pack_entries(_ID_I32, list(table.items()))
     
     @staticmethod
     def unpack_building_table(data: bytes) -> Tuple[Dict[int, int], int]:
@@ -349,20 +406,15 @@ class BoardBinaryProtocol:
         if len(data) < 5:
             raise BinaryProtocolError("Invalid building table data")
         
-        version = struct.unpack('>I', data[:4])[0]
+        version = _U32.unpack_from(data, 0)[0]
         count = data[4]
         
-        table = {}
-        offset = 5
-        
-        for i in range(count):
-            if offset + 5 > len(data):
-                raise BinaryProtocolError("Invalid building table entry")
-            
-            building_type, consumption = struct.unpack('>Bi', data[offset:offset+5])
-            table[building_type] = consumption
-            offset += 5
+        end = 5 + count * _ID_I32.size
+        if end > len(data):
+            raise BinaryProtocolError("Invalid building table entry")
         
+        # iter_unpack walks the entries in C; the memoryview avoids copying the body.
+        table = dict(_ID_I32.iter_unpack(memoryview(data)[5:end]))
         return table, version
     
     @staticmethod
@@ -372,14 +424,16 @@ class BoardBinaryProtocol:
         Pack game status for board polling
         Format: current_round(2) + total_rounds(2) + round_type_len(1) + round_type + expecting_data(1)
         """
-        data = struct.pack('>HH', current_round, total_rounds)
-        
         round_type_bytes = round_type.encode('utf-8')[:255]
-        data += struct.pack('B', len(round_type_bytes))
-        data += round_type_bytes
-        data += struct.pack('B', 1 if expecting_data else 0)
+        n = len(round_type_bytes)
+        
+        buf = bytearray(_GAME_STATUS_HDR.size + 2 + n)
+        _GAME_STATUS_HDR.pack_into(buf, 0, current_round, total_rounds)
+        buf[4] = n
+        buf[5:5 + n] = round_type_bytes
+        buf[5 + n] = 1 if expecting_data else 0
         
-        return data
+        return bytes(buf)
     
     @staticmethod
     def unpack_game_status(data: bytes) -> Tuple[int, int, str, bool]:
@@ -390,7 +444,7 @@ class BoardBinaryProtocol:
         if len(data) < 6:
             raise BinaryProtocolError("Invalid game status data")
         
-        current_round, total_rounds = struct.unpack('>HH', data[:4])
+        current_round, total_rounds = _GAME_STATUS_HDR.unpack_from(data, 0)
         round_type_len = data[4]
         
         if len(data) < 6 + round_type_len:
@@ -404,24 +458,24 @@ class BoardBinaryProtocol:
 # Utility functions for common binary operations
 def pack_uint32(value: int) -> bytes:
     """Pack a 32-bit unsigned integer in big-endian format"""
-    return struct.pack('>I', value)
+    return _U32.pack(value)
 
 def unpack_uint32(data: bytes, offset: int = 0) -> int:
     """Unpack a 32-bit unsigned integer from big-endian format"""
-    return struct.unpack('>I', data[offset:offset+4])[0]
+    return _U32.unpack_from(data, offset)[0]
 
 def pack_int32(value: int) -> bytes:
     """Pack a 32-bit signed integer in big-endian format"""
-    return struct.pack('>i', value)
+    return _I32.pack(value)
 
 def unpack_int32(data: bytes, offset: int = 0) -> int:
     """Unpack a 32-bit signed integer from big-endian format"""
-    return struct.unpack('>i', data[offset:offset+4])[0]
+    return _I32.unpack_from(data, offset)[0]
 
 def pack_float(value: float) -> bytes:
     """Pack a float in big-endian format"""
-    return struct.pack('>f', value)
+    return _F32.pack(value)
 
 def unpack_float(data: bytes, offset: int = 0) -> float:
     """Unpack a float from big-endian format"""
-    return struct.unpack('>f', data[offset:offset+4])[0]
+    return _F32.unpack_from(data, offset)[0]
@@ -1,5 +1,6 @@
 from flask import Flask, request, jsonify, send_from_directory
-from flask_cors import CORS
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.http import generate_etag
 import pickle
 import os
 import json
@@ -10,6 +11,10 @@ import logging
 import traceback
 import random
 import numpy as np
+try:
+    import orjson
+except ImportError:  # optional: JSON responses fall back to Flask's stdlib-json jsonify
+    orjson = None
 from state import GameState, available_scripts, available_script_generators, get_fresh_script, BoardState
 from simple_auth import require_lecturer_auth, require_board_auth, require_auth, optional_auth, auth
 from binary_protocol import BoardBinaryProtocol, BinaryProtocolError
@@ -65,10 +70,57 @@ if DEBUG_MODE:
 else:
     logger.warning("Application started in PRODUCTION mode - minimal logging enabled")
 
-# Enable CORS for all routes
-CORS(app, origins=['http://localhost'], 
-     allow_headers=['Content-Type', 'Authorization', 'X-Auth-Token'],
-     supports_credentials=True)
+# CORS for the lecturer frontend. The only allowed origin is static, so a single after_request
+# hook replaces flask_cors; board traffic sends no Origin header and returns immediately.
+CORS_ORIGIN = 'http://localhost'
+CORS_ALLOW_HEADERS = 'Content-Type, Authorization, X-Auth-Token'
+CORS_ALLOW_METHODS = 'DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT'
+
+@app.after_request
+def add_cors_headers(response):
+    """Add CORS headers for requests coming from CORS_ORIGIN, including preflight answers"""
+    if request.headers.get('Origin') != CORS_ORIGIN:
+        return response
+    headers = response.headers
+    headers['Access-Control-Allow-Origin'] = CORS_ORIGIN
+    headers['Access-Control-Allow-Credentials'] = 'true'
+    headers.add('Vary', 'Origin')
+    if request.method == 'OPTIONS' and 'Access-Control-Request-Method' in request.headers:
+        headers['Access-Control-Allow-Headers'] = CORS_ALLOW_HEADERS
+        headers['Access-Control-Allow-Methods'] = CORS_ALLOW_METHODS
+    return response
+
+# orjson handles NumPy arrays/scalars natively; anything else it can't encode goes through convert_numpy_types
+_ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+def json_response(payload, status=200):
+    """jsonify() replacement for hot JSON endpoints, serialized with orjson when it is installed"""
+    if orjson is None:
+        return jsonify(payload), status
+    body = orjson.dumps(payload, default=convert_numpy_types, option=_ORJSON_OPTIONS)
+    return app.response_class(body, status=status, mimetype='application/json')
+
+if orjson is not None:
+    class ORJSONProvider(DefaultJSONProvider):
+        """Serialize jsonify() and app.json output with orjson, with the same options as json_response(),
+        and parse request.get_json() bodies with orjson straight from the request bytes"""
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, default=convert_numpy_types, option=_ORJSON_OPTIONS).decode()
+
+        def response(self, *args, **kwargs):
+            obj = self._prepare_response_obj(args, kwargs)
+            body = orjson.dumps(obj, default=convert_numpy_types, option=_ORJSON_OPTIONS)
+            return self._app.response_class(body, mimetype=self.mimetype)
+
+    app.json = ORJSONProvider(app)
+
+def octet_response(body, status=200):
+    """Build a binary ESP32 response directly, skipping Flask's (body, status, headers) tuple handling"""
+    return app.response_class(body, status=status, mimetype='application/octet-stream')
 
 # Helper to determine if a script has an active round (avoids off-by-one issues)
 def is_game_active(script) -> bool:
@@ -93,11 +145,13 @@ class GroupGameManager:
     
     def get_game_state(self, group_id: str) -> GameState:
         """Get or create game state for a specific group"""
-        if group_id not in self.group_game_states:
+        # Single lookup on the common path where the group already exists
+        game_state = self.group_game_states.get(group_id)
+        if game_state is None:
             # Initialize with NO script - game is inactive by default
-            self.group_game_states[group_id] = GameState(None)
+            game_state = self.group_game_states[group_id] = GameState(None)
             self.game_ended_states[group_id] = False
-        return self.group_game_states[group_id]
+        return game_state
     
     def mark_game_ended(self, group_id: str):
         """Mark game as explicitly ended for a group"""
@@ -201,6 +255,20 @@ def generate_game_statistics(game_state: GameState):
     # Sort rounds chronologically
     sorted_rounds = sorted(all_round_indices)
     
+    # Index each board's history by round once, instead of scanning the history lists
+    # for every (round, board) pair below. The first entry for a round wins, as with list.index().
+    history_positions = {}
+    powerplant_by_round = {}
+    for board_id, board in game_state.boards.items():
+        positions = {}
+        for idx, round_index in enumerate(board.round_history):
+            positions.setdefault(round_index, idx)
+        history_positions[board_id] = positions
+        plants = {}
+        for powerplant_data in board.powerplant_history:
+            plants.setdefault(powerplant_data['round_index'], powerplant_data)
+        powerplant_by_round[board_id] = plants
+    
     # Build history for scoring system
     history = []
     
@@ -211,8 +279,8 @@ def generate_game_statistics(game_state: GameState):
             team_name = board.display_name
             
             # Get data for this specific round from board history
-            if round_index in board.round_history:
-                history_idx = board.round_history.index(round_index)
+            history_idx = history_positions[board_id].get(round_index)
+            if history_idx is not None:
                 
                 # Get consumption for this round
                 if history_idx < len(board.consumption_history):
@@ -221,7 +289,7 @@ def generate_game_statistics(game_state: GameState):
                     total_consumption = 0
                 
                 # Get power plant data for this round
-                powerplant_data = board.get_powerplant_history_for_round(round_index)
+                powerplant_data = powerplant_by_round[board_id].get(round_index)
                 productions = []
                 
                 if powerplant_data and 'power_generation_by_type' in powerplant_data:
@@ -677,75 +745,86 @@ def login():
     
     token = auth.generate_token(user_info)
     
-    return jsonify({
+    return json_response({
         'token': token,
         'user_type': user_info['user_type'],
         'username': user_info['username'],
         'group_id': user_info.get('group_id', 'group1')
     })
 
+# Packed coefficient section of the /poll_binary frame per group, as (production coeffs it was built from, bytes)
+_poll_prefix_cache = {}
+# Full /poll_binary frame per (group, board), as (prefix bytes, buildings list, frame bytes, ETag).
+# Every BoardState method that changes the buildings assigns a new list, so the two identity checks version the frame
+_poll_frame_cache = {}
+
 @app.route('/poll_binary', methods=['GET'])
 @require_board_auth
 def poll_binary():
     """Optimized binary poll endpoint for ESP32"""
     try:
         # Get board ID from authentication (from JWT username)
-        user = getattr(request, 'user', {})
+        user = request.user
         board_id = user.get('username', '')
         
         if not board_id:
-            return b'INVALID_BOARD', 400, {'Content-Type': 'application/octet-stream'}
+            return octet_response(b'INVALID_BOARD', 400)
         
-        # Get user's game state
-        user_game_state = get_user_game_state(request.user)
+        # Resolve the group once; it selects both the game state and the activity check below
+        group_id = user.get('group_id', 'group1')
+        user_game_state = group_manager.get_game_state(group_id)
         
         board = user_game_state.get_board(board_id)
         if not board:
-            return b'BOARD_NOT_FOUND', 404, {'Content-Type': 'application/octet-stream'}
+            return octet_response(b'BOARD_NOT_FOUND', 404)
 
         # Update last activity to mark board as active (for liveliness detection)
         board.update_last_activity()
         
-        script = user_game_state.get_script()
-        
         # Check game activity using group manager (considers both script and ended state)
-        group_id = user.get('group_id', 'group1')
         if not group_manager.is_game_active(group_id):
             # Return empty response when no game is active / game finished
             # This signals to ESP32 that game is paused/ended (gameActive = false)
-            return b'', 200, {'Content-Type': 'application/octet-stream'}
-
-        # Get production coefficients
-        prod_coeffs = script.getCurrentProductionCoefficients()
-        
-        # Get consumption for all buildings
-        cons_coeffs = {}
-        for building in Enak.Building:
-            consumption = script.getCurrentBuildingConsumption(building)
-            if consumption is not None:
-                cons_coeffs[building] = consumption
-
-        # Get connected buildings for this board
-        connected_buildings = board.get_connected_buildings()
-
-        # Pack the data using the new method
-        response = BoardBinaryProtocol.pack_coefficients_response(
-            production_coeffs=prod_coeffs,
-            consumption_coeffs=cons_coeffs,
-            connected_buildings=connected_buildings
-        )
-        
-        return response, 200, {'Content-Type': 'application/octet-stream'}
+            return octet_response(b'')
+
+        # Production and consumption coefficients, shared by all boards for the current round.
+        # Their packed section is built once per round; only the board's buildings are packed per request
+        prod_coeffs, cons_coeffs = user_game_state.get_round_coefficients()
+        cached = _poll_prefix_cache.get(group_id)
+        if cached is None or cached[0] is not prod_coeffs:
+            cached = (prod_coeffs, BoardBinaryProtocol.pack_coefficients_prefix(prod_coeffs, cons_coeffs))
+            _poll_prefix_cache[group_id] = cached
+
+        prefix = cached[1]
+        buildings = board.connected_buildings
+        frame_key = (group_id, board_id)
+        frame = _poll_frame_cache.get(frame_key)
+        
+        # The coefficients only change between rounds: boards that send back the ETag
+        # in If-None-Match get an empty 304 instead of the full frame
+        if frame is not None and frame[0] is prefix and frame[1] is buildings:
+            response = octet_response(frame[2])
+            response.set_etag(frame[3])
+        else:
+            # The packer only reads the board's buildings, so pass the list itself rather than a get_connected_buildings() copy
+            response = octet_response(BoardBinaryProtocol.pack_coefficients_with_prefix(prefix, buildings))
+            response.add_etag()
+            _poll_frame_cache[frame_key] = (prefix, buildings, response.get_data(), response.get_etag()[0])
+        return response.make_conditional(request)
         
     except BinaryProtocolError as e:
         logger.error(f"Binary protocol error in poll_binary: {e}")
-        return b'PROTOCOL_ERROR', 500, {'Content-Type': 'application/octet-stream'}
+        return octet_response(b'PROTOCOL_ERROR', 500)
     except Exception as e:
         logger.error(f"Internal error in poll_binary: {e}")
         logger.error(f"Traceback: {traceback.format_exc()}")
-        return b'INTERNAL_ERROR', 500, {'Content-Type': 'application/octet-stream'}
+        return octet_response(b'INTERNAL_ERROR', 500)
+
 
 
+# Packed /prod_vals and /cons_vals payloads per group, as (what they were built from, bytes, ETag)
+_prod_vals_cache = {}
+_cons_vals_cache = {}
 
 @app.route('/prod_vals', methods=['GET'])
 @require_board_auth
@@ -753,11 +832,11 @@ def get_production_values():
     """Binary endpoint - Get power plant production ranges"""
     try:
         # Get board ID from authentication (from JWT username)
-        user = getattr(request, 'user', {})
+        user = request.user
         board_id = user.get('username', '')
         
         if not board_id:
-            return b'INVALID_BOARD', 400, {'Content-Type': 'application/octet-stream'}
+            return octet_response(b'INVALID_BOARD', 400)
 
         # Get user's game state
         user_game_state = get_user_game_state(request.user)
@@ -769,28 +848,37 @@ def get_production_values():
         
         script = user_game_state.get_script()
         if not script:
-            return b'SCRIPT_NOT_FOUND', 404, {'Content-Type': 'application/octet-stream'}
+            return octet_response(b'SCRIPT_NOT_FOUND', 404)
         
-        # Get production ranges from script (includes coefficients applied)
-        from enak.Enak import Source
-        prod_ranges = {}
-        
-        # Get all available sources and their current production ranges
-        for source in Source:
-            range_values = script.getCurrentProductionRange(source)
-            if range_values and range_values != (0.0, 0.0):
-                prod_ranges[source] = range_values
-        if DEBUG_MODE:
-            logger.debug(f"Production ranges: {prod_ranges}")
+        # Ranges only change with the round, so every board in the group shares one packed payload per round
+        group_id = user.get('group_id', 'group1')
+        cache_key = (script, script.current_round_index)
+        cached = _prod_vals_cache.get(group_id)
+        if cached is None or cached[0] != cache_key:
+            # Get production ranges from script (includes coefficients applied)
+            prod_ranges = {}
+            
+            # Get all available sources and their current production ranges
+            for source in Enak.Source:
+                range_values = script.getCurrentProductionRange(source)
+                if range_values and range_values != (0.0, 0.0):
+                    prod_ranges[source] = range_values
+            if DEBUG_MODE:
+                logger.debug(f"Production ranges: {prod_ranges}")
+            
+            body = BoardBinaryProtocol.pack_production_ranges(prod_ranges)
+            cached = (cache_key, body, generate_etag(body))
+            _prod_vals_cache[group_id] = cached
         
-        # Pack using binary protocol
-        data = BoardBinaryProtocol.pack_production_ranges(prod_ranges)
-        return data, 200, {'Content-Type': 'application/octet-stream'}
+        # Boards that send back the ETag get a 304 while the ranges are unchanged
+        response = octet_response(cached[1])
+        response.set_etag(cached[2])
+        return response.make_conditional(request)
         
     except Exception as e:
         logger.error(f"Error in get_production_values: {e}")
         logger.error(f"Traceback: {traceback.format_exc()}")
-        return b'ERROR', 500, {'Content-Type': 'application/octet-stream'}
+        return octet_response(b'ERROR', 500)
 
 @app.route('/cons_vals', methods=['GET'])
 @require_board_auth
@@ -798,11 +886,11 @@ def get_consumption_values():
     """Binary endpoint - Get consumer consumption values"""
     try:
         # Get board ID from authentication (from JWT username)
-        user = getattr(request, 'user', {})
+        user = request.user
         board_id = user.get('username', '')
         
         if not board_id:
-            return b'INVALID_BOARD', 400, {'Content-Type': 'application/octet-stream'}
+            return octet_response(b'INVALID_BOARD', 400)
 
         # Get user's game state
         user_game_state = get_user_game_state(request.user)
@@ -814,23 +902,26 @@ def get_consumption_values():
         
         script = user_game_state.get_script()
         if not script:
-            return b'SCRIPT_NOT_FOUND', 404, {'Content-Type': 'application/octet-stream'}
+            return octet_response(b'SCRIPT_NOT_FOUND', 404)
         
-        # Get consumption for all buildings from script
-        cons_coeffs = {}
-        for building in Enak.Building:
-            consumption = script.getCurrentBuildingConsumption(building)
-            if consumption is not None:
-                cons_coeffs[building] = consumption
+        # Consumption for all buildings, shared by all boards for the current round and packed once per round
+        cons_coeffs = user_game_state.get_round_coefficients()[1]
+        group_id = user.get('group_id', 'group1')
+        cached = _cons_vals_cache.get(group_id)
+        if cached is None or cached[0] is not cons_coeffs:
+            body = BoardBinaryProtocol.pack_consumption_values(cons_coeffs)
+            cached = (cons_coeffs, body, generate_etag(body))
+            _cons_vals_cache[group_id] = cached
         
-        # Pack using binary protocol
-        data = BoardBinaryProtocol.pack_consumption_values(cons_coeffs)
-        return data, 200, {'Content-Type': 'application/octet-stream'}
+        # Boards that send back the ETag get a 304 while the consumptions are unchanged
+        response = octet_response(cached[1])
+        response.set_etag(cached[2])
+        return response.make_conditional(request)
         
     except Exception as e:
         logger.error(f"Error in get_consumption_values: {e}")
         logger.error(f"Traceback: {traceback.format_exc()}")
-        return b'ERROR', 500, {'Content-Type': 'application/octet-stream'}
+        return octet_response(b'ERROR', 500)
 
 @app.route('/post_vals', methods=['POST'])
 @require_board_auth
@@ -844,15 +935,16 @@ def post_values():
             production, consumption, connected_buildings = BoardBinaryProtocol.unpack_power_data_with_buildings(data)
         except BinaryProtocolError as e:
             logger.error(f"Invalid power data format from board - new format required: {e}")
-            return b'INVALID_FORMAT', 400, {'Content-Type': 'application/octet-stream'}
+            return octet_response(b'INVALID_FORMAT', 400)
         
-        print(f"Received production: {production}, consumption: {consumption}, buildings: {len(connected_buildings)}", file=sys.stderr)
+        if DEBUG_MODE:
+            logger.debug(f"Received production: {production}, consumption: {consumption}, buildings: {len(connected_buildings)}")
         # Get board ID from authentication (from JWT username)
-        user = getattr(request, 'user', {})
+        user = request.user
         board_id = user.get('username', '')
         
         if not board_id:
-            return b'INVALID_BOARD', 400, {'Content-Type': 'application/octet-stream'}
+            return octet_response(b'INVALID_BOARD', 400)
         
         # Get user's game state
         user_game_state = get_user_game_state(request.user)
@@ -860,32 +952,46 @@ def post_values():
         # Get the board and update power
         board = user_game_state.get_board(board_id)
         if not board:
-            return b'BOARD_NOT_FOUND', 404, {'Content-Type': 'application/octet-stream'}
+            return octet_response(b'BOARD_NOT_FOUND', 404)
         
         # Always replace connected buildings list since all boards now send new format
-        previous_count = len(board.get_connected_buildings()) if hasattr(board, 'get_connected_buildings') else 'n/a'
-        board.clear_connected_buildings()
-        if connected_buildings:
-            for building in connected_buildings:
-                try:
-                    board.add_connected_building(building['uid'], building['building_type'])
-                except Exception as e:
-                    print(f"Failed to add building {building}: {e}", file=sys.stderr)
+        if DEBUG_MODE:
+            previous_count = len(board.get_connected_buildings())
+        board.replace_connected_buildings(connected_buildings)
         # Debug trace to verify clearing behavior
-        print(f"Board {board_id}: replaced connected_buildings (prev={previous_count}, new={len(connected_buildings)})", file=sys.stderr)
+        if DEBUG_MODE:
+            logger.debug(f"Board {board_id}: replaced connected_buildings (prev={previous_count}, new={len(connected_buildings)})")
         
         # Pass the script to track round changes
         script = user_game_state.get_script()
         board.update_power(production, consumption, script)
-        return b'OK', 200, {'Content-Type': 'application/octet-stream'}
+        return octet_response(b'OK')
         
     except BinaryProtocolError as e:
         logger.error(f"Binary protocol error in post_values: {e}")
-        return b'PROTOCOL_ERROR', 400, {'Content-Type': 'application/octet-stream'}
+        return octet_response(b'PROTOCOL_ERROR', 400)
     except Exception as e:
         logger.error(f"Error in post_values: {e}")
         logger.error(f"Traceback: {traceback.format_exc()}")
-        return b'ERROR', 500, {'Content-Type': 'application/octet-stream'}
+        return octet_response(b'ERROR', 500)
+
+# Map numeric power plant IDs (from firmware) to source names expected by scoring.
+# These IDs MUST stay aligned with power_plant_config.h / Enak.Source.
+PLANT_ID_TO_SOURCE = {
+    1: 'PHOTOVOLTAIC',
+    2: 'WIND',
+    3: 'NUCLEAR',
+    4: 'GAS',
+    5: 'HYDRO',
+    6: 'HYDRO_STORAGE',
+    7: 'COAL',
+    8: 'BATTERY'
+}
+SOURCE_TO_PLANT_ID = {source: pid for pid, source in PLANT_ID_TO_SOURCE.items()}
+
+# Precompiled entry formats for the connected-device reports (avoids re-parsing the format per request)
+_CONNECTED_PLANT = struct.Struct('>Ii')   # plant_id(4) + set_power_mW(4)
+_CONNECTED_CONSUMER = struct.Struct('>I')  # consumer_id(4)
 
 @app.route('/prod_connected', methods=['POST'])
 @require_board_auth
@@ -894,27 +1000,23 @@ def post_production_connected():
     try:
         data = request.get_data()
         if len(data) < 1:
-            return b'INVALID_DATA', 400, {'Content-Type': 'application/octet-stream'}
+            return octet_response(b'INVALID_DATA', 400)
         
         # Unpack: count(1) + [id(4) + set_power(4)] * count
-        count = struct.unpack('B', data[:1])[0]
-        offset = 1
+        count = data[0]
+        end = 1 + count * _CONNECTED_PLANT.size
+        if end > len(data):
+            return octet_response(b'INVALID_DATA', 400)
         
         # power_plants: plant_id -> set_power_mW (as sent from board)
-        power_plants: dict[int,int] = {}
-        for i in range(count):
-            if offset + 8 > len(data):
-                return b'INVALID_DATA', 400, {'Content-Type': 'application/octet-stream'}
-            plant_id, set_power_mw = struct.unpack('>Ii', data[offset:offset+8])
-            power_plants[plant_id] = set_power_mw
-            offset += 8
+        power_plants: dict[int,int] = dict(_CONNECTED_PLANT.iter_unpack(memoryview(data)[1:end]))
         
         # Get board ID from authentication (from JWT username)
-        user = getattr(request, 'user', {})
+        user = request.user
         board_id = user.get('username', '')
         
         if not board_id:
-            return b'INVALID_BOARD', 400, {'Content-Type': 'application/octet-stream'}
+            return octet_response(b'INVALID_BOARD', 400)
         
         # Get user's game state
         user_game_state = get_user_game_state(request.user)
@@ -925,48 +1027,27 @@ def post_production_connected():
             # Store just the IDs for backwards compatibility / UI
             board.replace_connected_production(list(power_plants.keys()))
 
-            # Map numeric IDs (from firmware) to source names expected by scoring.
-            # These IDs MUST stay aligned with power_plant_config.h / Enak.Source.
-            ID_TO_SOURCE = {
-                1: 'PHOTOVOLTAIC',
-                2: 'WIND',
-                3: 'NUCLEAR',
-                4: 'GAS',
-                5: 'HYDRO',
-                6: 'HYDRO_STORAGE',
-                7: 'COAL',
-                8: 'BATTERY'
-            }
-
             # Update per‑type generation in Watts (board sends mW)
-            reported_ids = set()
+            reported_sources = set()
             for pid, mw in power_plants.items():
-                if pid in ID_TO_SOURCE:
-                    reported_ids.add(pid)
-                    watts = mw / 1000.0
-                    board.update_power_generation_by_type(ID_TO_SOURCE[pid], float(watts))
+                source = PLANT_ID_TO_SOURCE.get(pid)
+                if source:
+                    reported_sources.add(source)
+                    board.update_power_generation_by_type(source, mw / 1000.0)
             # Zero out any previously present types that are no longer reported (disconnected)
-            existing_types = list(board.get_all_power_generation_by_type().keys())
-            for existing in existing_types:
-                # Find its numeric id inverse map
-                # If its id not in reported_ids this cycle, set to zero to avoid stale values
-                try:
-                    # Build inverse lookup lazily
-                    # (cheap given tiny mapping)
-                    inv = {v: k for k, v in ID_TO_SOURCE.items()}
-                    if inv.get(existing) and inv[existing] not in reported_ids:
-                        board.update_power_generation_by_type(existing, 0.0)
-                except Exception:
-                    pass
-
-            return b'OK', 200, {'Content-Type': 'application/octet-stream'}
+            # to avoid stale values
+            for existing in board.get_all_power_generation_by_type():
+                if existing in SOURCE_TO_PLANT_ID and existing not in reported_sources:
+                    board.update_power_generation_by_type(existing, 0.0)
+
+            return octet_response(b'OK')
         else:
-            return b'BOARD_NOT_FOUND', 404, {'Content-Type': 'application/octet-stream'}
+            return octet_response(b'BOARD_NOT_FOUND', 404)
         
     except Exception as e:
         logger.error(f"Error in post_production_connected: {e}")
         logger.error(f"Traceback: {traceback.format_exc()}")
-        return b'ERROR', 500, {'Content-Type': 'application/octet-stream'}
+        return octet_response(b'ERROR', 500)
 
 @app.route('/cons_connected', methods=['POST'])
 @require_board_auth
@@ -975,27 +1056,22 @@ def post_consumption_connected():
     try:
         data = request.get_data()
         if len(data) < 1:
-            return b'INVALID_DATA', 400, {'Content-Type': 'application/octet-stream'}
+            return octet_response(b'INVALID_DATA', 400)
         
         # Unpack: count(1) + [id(4)] * count
-        count = struct.unpack('B', data[:1])[0]
-        offset = 1
+        count = data[0]
+        end = 1 + count * _CONNECTED_CONSUMER.size
+        if end > len(data):
+            return octet_response(b'INVALID_DATA', 400)
         
-        consumers = []
-        for i in range(count):
-            if offset + 4 > len(data):
-                return b'INVALID_DATA', 400, {'Content-Type': 'application/octet-stream'}
-            
-            consumer_id = struct.unpack('>I', data[offset:offset+4])[0]
-            consumers.append(consumer_id)
-            offset += 4
+        consumers = [consumer_id for (consumer_id,) in _CONNECTED_CONSUMER.iter_unpack(memoryview(data)[1:end])]
         
         # Get board ID from authentication (from JWT username)
-        user = getattr(request, 'user', {})
+        user = request.user
         board_id = user.get('username', '')
         
         if not board_id:
-            return b'INVALID_BOARD', 400, {'Content-Type': 'application/octet-stream'}
+            return octet_response(b'INVALID_BOARD', 400)
         
         # Get user's game state
         user_game_state = get_user_game_state(request.user)
@@ -1004,14 +1080,19 @@ def post_consumption_connected():
         board = user_game_state.get_board(board_id)
         if board:
             board.replace_connected_consumption(consumers)
-            return b'OK', 200, {'Content-Type': 'application/octet-stream'}
+            return octet_response(b'OK')
         else:
-            return b'BOARD_NOT_FOUND', 404, {'Content-Type': 'application/octet-stream'}
+            return octet_response(b'BOARD_NOT_FOUND', 404)
         
     except Exception as e:
         logger.error(f"Error in post_consumption_connected: {e}")
         logger.error(f"Traceback: {traceback.format_exc()}")
-        return b'ERROR', 500, {'Content-Type': 'application/octet-stream'}
+        return octet_response(b'ERROR', 500)
+
+# /register only ever answers with these fixed frames, so pack them once
+_REGISTRATION_OK = BoardBinaryProtocol.pack_registration_response(True, "Registration successful")
+_REGISTRATION_INVALID_BOARD = BoardBinaryProtocol.pack_registration_response(False, "Invalid board authentication")
+_REGISTRATION_ERROR = BoardBinaryProtocol.pack_registration_response(False, "Internal error")
 
 @app.route('/register', methods=['POST'])
 @require_board_auth
@@ -1019,13 +1100,12 @@ def register():
     """Binary board registration endpoint - board ID extracted from JWT only"""
     try:
         # Extract board ID from JWT token, not from request data
-        user = getattr(request, 'user', {})
+        user = request.user
         board_id = user.get('username', '')
         
         if not board_id:
             logger.error(f"Invalid board username in register: {board_id}")
-            response = BoardBinaryProtocol.pack_registration_response(False, "Invalid board authentication")
-            return response, 400, {'Content-Type': 'application/octet-stream'}
+            return octet_response(_REGISTRATION_INVALID_BOARD, 400)
         
         # Get user's game state
         user_game_state = get_user_game_state(request.user)
@@ -1037,26 +1117,26 @@ def register():
         board.update_last_activity()
         
         logger.info(f"Board {board_id} registered successfully")
-        response = BoardBinaryProtocol.pack_registration_response(True, "Registration successful")
-        return response, 200, {'Content-Type': 'application/octet-stream'}
+        return octet_response(_REGISTRATION_OK)
         
     except Exception as e:
         logger.error(f"Internal error in register: {e}")
         logger.error(f"Traceback: {traceback.format_exc()}")
-        response = BoardBinaryProtocol.pack_registration_response(False, "Internal error")
-        return response, 500, {'Content-Type': 'application/octet-stream'}
+        return octet_response(_REGISTRATION_ERROR, 500)
 
 # Frontend/Lecturer Endpoints
 
+# available_scripts is filled once when state is imported, so the scenario listing never changes
+_SCENARIOS_PAYLOAD = {
+    "success": True,
+    "scenarios": list(available_scripts.keys())
+}
+
 @app.route('/scenarios', methods=['GET'])
 @require_lecturer_auth
 def get_scenarios():
     """Get list of available scenarios"""
-    scenarios = list(available_scripts.keys())
-    return jsonify({
-        "success": True,
-        "scenarios": scenarios
-    })
+    return json_response(_SCENARIOS_PAYLOAD)
 
 @app.route('/start_game', methods=['POST'])
 @require_lecturer_auth
@@ -1072,7 +1152,7 @@ def start_game_scenario():
         return jsonify({"error": "Invalid scenario ID"}), 400
     
     # Get user information for group management
-    user = getattr(request, 'user', {})
+    user = request.user
     group_id = user.get('group_id', 'group1')
     
     # Get a fresh script instance to ensure clean state
@@ -1137,7 +1217,7 @@ def next_round():
     if not script:
         return jsonify({"error": "No active game script"}), 400
     
-    user = getattr(request, 'user', {})
+    user = request.user
     lecturer_name = user.get('username', 'Unknown Lecturer')
     
     # Save current round data to history for all boards BEFORE advancing
@@ -1241,7 +1321,7 @@ def next_round():
             
             response_data["display_data"] = display_data
         
-        return jsonify(response_data)
+        return json_response(response_data)
     else:
         # Game is finished, finalize current round for all boards
         user_game_state.finalize_all_boards_current_round()
@@ -1257,7 +1337,7 @@ def next_round():
             pass
         
         # Mark game as explicitly ended in the group manager
-        user = getattr(request, 'user', {})
+        user = request.user
         group_id = user.get('group_id', 'group1')
         group_manager.mark_game_ended(group_id)
         debug_print(f"Game finished and marked as ended for group {group_id}")
@@ -1278,6 +1358,8 @@ def get_statistics():
     
     script = user_game_state.get_script()
     
+    # One clock reading for every board and the connection summary, so they agree with each other
+    now = time.time()
     statistics = []
     
     for board_id, board in user_game_state.boards.items():
@@ -1286,8 +1368,8 @@ def get_statistics():
             "display_name": board.display_name,
             "current_production": board.production,
             "current_consumption": board.consumption,
-            "connected": board.is_connected(),
-            "time_since_update": board.time_since_last_update(),
+            "connected": board.is_connected(now),
+            "time_since_update": board.time_since_last_update(now),
             "production_history": board.production_history,
             "consumption_history": board.consumption_history,
             "round_history": board.round_history,
@@ -1300,13 +1382,13 @@ def get_statistics():
         statistics.append(stats)
     
     # Get connection summary
-    connection_summary = user_game_state.get_connection_summary()
+    connection_summary = user_game_state.get_connection_summary(now)
     
     # Get user group for accurate game status
-    user = getattr(request, 'user', {})
+    user = request.user
     group_id = user.get('group_id', 'group1')
     
-    return jsonify({
+    return json_response({
         "success": True,
         "statistics": statistics,
         "connection_summary": connection_summary,
@@ -1345,8 +1427,8 @@ def get_game_statistics():
     try:
         user_config = get_user_config()
         if user_config and user_config.config and 'boards' in user_config.config:
-            for board_id in user_config.config['boards'].keys():
-                display_name = user_config.get_board_display_name(board_id)
+            for board_id, board_info in user_config.config['boards'].items():
+                display_name = board_info.get('display_name')
                 if display_name:
                     # Map both "board1" and "1" to handle different board_id formats
                     board_names[board_id] = display_name
@@ -1357,7 +1439,7 @@ def get_game_statistics():
     except Exception as e:
         debug_print(f"Error creating board names mapping for statistics: {e}")
     
-    return jsonify({
+    return json_response({
         "success": True,
         "game_statistics": game_statistics,
         "board_names": board_names,
@@ -1402,7 +1484,7 @@ def get_powerplant_history():
             "current_power_generation": board.power_generation_by_type
         }
     
-    return jsonify({
+    return json_response({
         "success": True,
         "powerplant_data": powerplant_data,
         "game_status": {
@@ -1433,7 +1515,7 @@ def end_game():
     # Reset script to null/none (no active game)
     user_game_state.script = None
     
-    user = getattr(request, 'user', {})
+    user = request.user
     lecturer_name = user.get('username', 'Unknown Lecturer')
     
     return jsonify({
@@ -1453,21 +1535,18 @@ def poll_for_users():
     # Prune disconnected boards to ensure accurate connection status
     #HACK: FIXME: TODO: user_game_state.prune_disconnected_boards() #needs a proper fix for boards to not appear in the end statistics
     
-    all_boards = []
-    
-    # Get connected boards
-    for board_id, board in user_game_state.boards.items():
-        all_boards.append(board.to_dict())
+    # Every registered board, connected or not; used to skip them when adding placeholders
+    registered_boards = user_game_state.boards
+    all_boards, connection_summary = user_game_state.get_all_board_status()
     
     # Add placeholder entries for configured but not connected boards
     from user_config import get_user_config
     try:
         user_config = get_user_config()
         if user_config and user_config.config and 'boards' in user_config.config:
-            connected_board_ids = set(user_game_state.boards.keys())
-            for config_board_id in user_config.config['boards'].keys():
+            for config_board_id in user_config.config['boards']:
                 # Use the full config_board_id as the board_id (no more parsing)
-                if config_board_id not in connected_board_ids:
+                if config_board_id not in registered_boards:
                     # Create placeholder for disconnected board
                     placeholder_board = {
                         'board_id': config_board_id,
@@ -1487,12 +1566,6 @@ def poll_for_users():
     except Exception as e:
         debug_print(f"Error adding placeholder boards: {e}")
     
-    # Parse user metadata
-    user = getattr(request, 'user', {})
-    
-    # Get connection summary
-    connection_summary = user_game_state.get_connection_summary()
-    
     # Build detailed round information
     round_details = {}
     if script and script.current_round_index > 0:
@@ -1578,8 +1651,8 @@ def poll_for_users():
     try:
         user_config = get_user_config()
         if user_config and user_config.config and 'boards' in user_config.config:
-            for board_id in user_config.config['boards'].keys():
-                display_name = user_config.get_board_display_name(board_id)
+            for board_id, board_info in user_config.config['boards'].items():
+                display_name = board_info.get('display_name')
                 if display_name:
                     # Map both "board1" and "1" to handle different board_id formats
                     board_names[board_id] = display_name
@@ -1591,10 +1664,11 @@ def poll_for_users():
         debug_print(f"Error creating board names mapping: {e}")
     
     # Get user group for game status
-    user = getattr(request, 'user', {})
+    user = request.user
     group_id = user.get('group_id', 'group1')
     
-    return jsonify({
+    # Polled continuously by every lecturer dashboard, so serialize with orjson
+    return json_response({
         "boards": all_boards,
         "connection_summary": connection_summary,
         "game_status": {
@@ -1611,27 +1685,46 @@ def poll_for_users():
         "board_names": board_names
     })
 
+def game_state_cache_key(group_id: str, game_state: GameState, script) -> tuple:
+    """
+    Everything the /game/status and /health payloads are built from: the script, its round,
+    the board count and an explicit game end. Their cached bodies are reused while this is unchanged.
+    """
+    return (script, script.current_round_index if script else None,
+            len(game_state.boards), group_manager.is_game_ended(group_id))
+
+# Serialized /game/status payload per group, with the inputs it was built from
+_game_status_cache = {}
+
 @app.route('/game/status', methods=['GET'])
 @optional_auth
 def game_status():
-    # Get user's game state  
-    user_game_state = get_user_game_state(getattr(request, 'user', {'group_id': 'group1'}))
+    # optional_auth leaves request.user as None for anonymous callers
+    user = request.user
+    user_game_state = get_user_game_state(user)
     script = user_game_state.get_script()
     
     # Get group_id for game activity check
-    user = getattr(request, 'user', {'group_id': 'group1'})
-    group_id = user.get('group_id', 'group1')
+    group_id = user.get('group_id', 'group1') if user else 'group1'
     
-    base_status = {
-        "current_round": script.current_round_index if script else 0,
-        "total_rounds": len(script.rounds) if script else 0,
-        "round_type": script.getCurrentRoundType().value if script and script.getCurrentRoundType() else None,
-        "game_active": group_manager.is_game_active(group_id),
-        "boards": len(user_game_state.boards)
-    }
+    cache_key = game_state_cache_key(group_id, user_game_state, script)
+    cached = _game_status_cache.get(group_id)
+    if cached is not None and cached[0] == cache_key:
+        body = cached[1]
+    else:
+        round_type = script.getCurrentRoundType() if script else None
+        base_status = {
+            "current_round": script.current_round_index if script else 0,
+            "total_rounds": len(script.rounds) if script else 0,
+            "round_type": round_type.value if round_type else None,
+            "game_active": group_manager.is_game_active(group_id),
+            "boards": len(user_game_state.boards)
+        }
+        # The payload has a fixed shape, so it is serialized once and the bytes are served until it changes
+        body = app.json.dumps(base_status).encode('utf-8')
+        _game_status_cache[group_id] = (cache_key, body)
     
     # Add detailed information for authenticated users
-    user = getattr(request, 'user', None)
     if user:
         user_type = user.get('user_type')
         if user_type == 'lecturer':
@@ -1639,22 +1732,32 @@ def game_status():
         elif user_type == 'board':
             pass
     
-    return jsonify(base_status)
+    return app.response_class(body, mimetype='application/json')
+
+# Last serialized /health payload, with the inputs it was built from
+_health_cache = None
 
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint for Docker and load balancers"""
+    global _health_cache
     # Use default game state for health check
     default_game_state = group_manager.get_game_state('group1')
     script = default_game_state.get_script()
     
-    return jsonify({
-        "status": "healthy",
-        "service": "CoreAPI",
-        "boards_registered": len(default_game_state.boards),
-        "game_active": group_manager.is_game_active('group1'),
-        "current_round": script.current_round_index if script else None
-    })
+    cache_key = game_state_cache_key('group1', default_game_state, script)
+    cached = _health_cache
+    if cached is None or cached[0] != cache_key:
+        body = app.json.dumps({
+            "status": "healthy",
+            "service": "CoreAPI",
+            "boards_registered": len(default_game_state.boards),
+            "game_active": group_manager.is_game_active('group1'),
+            "current_round": script.current_round_index if script else None
+        }).encode('utf-8')
+        cached = _health_cache = (cache_key, body)
+    
+    return app.response_class(cached[1], mimetype='application/json')
 
 @app.route('/building_table', methods=['GET'])
 @require_lecturer_auth
@@ -1667,14 +1770,11 @@ def get_building_table():
     if not script:
         return jsonify({'error': 'No active script'}), 400
     
-    # Get building consumptions from script
-    table = {}
-    for building in Enak.Building:
-        consumption = script.getCurrentBuildingConsumption(building)
-        if consumption is not None:
-            table[building.value] = consumption
+    # Building consumptions for the current round, computed once per round and shared with the board endpoints
+    cons_coeffs = user_game_state.get_round_coefficients()[1]
+    table = {building.value: consumption for building, consumption in cons_coeffs.items()}
     
-    return jsonify({
+    return json_response({
         'success': True,
         'table': table,
         'version': 1  # Static version since it comes from script
@@ -1686,7 +1786,7 @@ def dashboard():
     """Get user profile information for the dashboard"""
     user_info = request.user
     
-    return jsonify({
+    return json_response({
         'success': True,
         'user': {
             'id': user_info['user_id'],  # JWT payload uses 'user_id' not 'id'
@@ -1696,10 +1796,8 @@ def dashboard():
         }
     })
 
-@app.route('/translations', methods=['GET'])
-def get_translations():
-    """Get translation dictionaries for the dashboard"""
-    
+def _build_translations_body() -> bytes:
+    """Serialize the priority-filtered DISPLAY_TRANSLATIONS for /translations"""
     # Apply priority filtering to weather translations
     filtered_weather = {}
     for k, v in DISPLAY_TRANSLATIONS.items():
@@ -1712,11 +1810,19 @@ def get_translations():
         if k in ['DAY', 'NIGHT']:
             filtered_round_types[k] = filter_effects_by_priority(v.copy())
     
-    return jsonify({
+    return app.json.dumps({
         'success': True,
         'weather': filtered_weather,
         'round_types': filtered_round_types
-    })
+    }).encode('utf-8')
+
+# DISPLAY_TRANSLATIONS never changes at runtime, so the filtered response body is built once
+_TRANSLATIONS_BODY = _build_translations_body()
+
+@app.route('/translations', methods=['GET'])
+def get_translations():
+    """Get translation dictionaries for the dashboard"""
+    return app.response_class(_TRANSLATIONS_BODY, mimetype='application/json')
 
 # Lecturer Interface Endpoints (Lecturer Authentication Required)
 
@@ -1808,7 +1914,7 @@ def lecturer_simulation_dump():
             simulation_data["groups"][group_id] = group_data
             simulation_data["summary"]["total_groups"] += 1
         
-        return jsonify(simulation_data)
+        return json_response(simulation_data)
         
     except Exception as e:
         logger.error(f"Error in lecturer_simulation_dump: {e}")
@@ -1848,7 +1954,7 @@ def lecturer_submit_board_data():
             return jsonify({'error': 'JSON data required'}), 400
         
         # Extract required fields
-        lecturer_user = getattr(request, 'user', {})
+        lecturer_user = request.user
         lecturer_group_id = lecturer_user.get('group_id', 'group1')
         
         group_id = data.get('group_id', lecturer_group_id)  # Use lecturer's group if not specified
@@ -1873,10 +1979,7 @@ def lecturer_submit_board_data():
         group_game_state = group_manager.get_game_state(group_id)
         
         # Get or create the board
-        if board_id not in group_game_state.boards:
-            group_game_state.register_board(board_id)
-        
-        board = group_game_state.get_board(board_id)
+        board = group_game_state.register_board(board_id)
         
         # Update basic power data with script for round tracking
         script = group_game_state.get_script()
@@ -1963,17 +2066,17 @@ def lecturer_board_status(group_id, board_id):
         group_game_state = group_manager.get_game_state(group_id)
         
         # Check if board exists
-        if board_id not in group_game_state.boards:
+        board = group_game_state.boards.get(board_id)
+        if board is None:
             return jsonify({
                 'error': 'Board not found',
                 'group_id': group_id,
                 'board_id': board_id
             }), 404
         
-        board = group_game_state.get_board(board_id)
         script = group_game_state.get_script()
         
-        return jsonify({
+        return json_response({
             'success': True,
             'group_id': group_id,
             'board_id': board_id,
@@ -2013,10 +2116,7 @@ def lecturer_simulate_board_poll(group_id, board_id):
         group_game_state = group_manager.get_game_state(group_id)
         
         # Check if board exists, create if not
-        if board_id not in group_game_state.boards:
-            group_game_state.register_board(board_id)
-        
-        board = group_game_state.get_board(board_id)
+        board = group_game_state.register_board(board_id)
         script = group_game_state.get_script()
         
         if not script:
@@ -2041,7 +2141,7 @@ def lecturer_simulate_board_poll(group_id, board_id):
             if consumption is not None:
                 cons_coeffs[building.name] = consumption
 
-        lecturer_user = getattr(request, 'user', {})
+        lecturer_user = request.user
         
         return jsonify({
             'success': True,
@@ -2081,7 +2181,7 @@ def lecturer_simulate_board_register(group_id, board_id):
         # Register the board
         group_game_state.register_board(board_id)
         
-        lecturer_user = getattr(request, 'user', {})
+        lecturer_user = request.user
         logger.info(f"Lecturer {lecturer_user.get('username', 'Unknown')} simulated registration for group {group_id}, board {board_id}")
         
         return jsonify({
@@ -2113,7 +2213,7 @@ def get_power_generation_by_type(board_id):
         if not board:
             return jsonify({'error': 'Board not found'}), 404
         
-        return jsonify({
+        return json_response({
             'success': True,
             'board_id': board_id,
             'power_generation_by_type': board.get_all_power_generation_by_type()
@@ -2206,7 +2306,7 @@ def lecturer_get_all_power_generation():
                 'last_updated': board.last_updated
             }
         
-        return jsonify({
+        return json_response({
             'success': True,
             'power_generation_data': all_power_data
         })
@@ -2240,7 +2340,7 @@ def get_connection_status():
             }
             detailed_boards.append(board_info)
         
-        return jsonify({
+        return json_response({
             'success': True,
             'connection_summary': connection_summary,
             'detailed_boards': detailed_boards,
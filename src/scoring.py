@@ -75,15 +75,17 @@ def get_max_co2(team_stats, team):
 	total_cons = get_total_consumption(team_stats, team)
 	return co2eq[Power.COAL] * total_cons
 
-def get_co2(team_stats, team):
-	consumptions = team_stats[team]["consumptions"]
-	productions = team_stats[team]["productions"]
+def get_merit_orders(team_stats, team):
+	# One MeritOrder per round, built once and shared by the CO2 and expense scores
+	stats = team_stats[team]
+
+	if "merit_orders" not in stats:
+		stats["merit_orders"] = [MeritOrder(prices, p, c) for (c, p) in zip(stats["consumptions"], stats["productions"])]
 
-	co2 = []
+	return stats["merit_orders"]
 
-	for (c, p) in zip(consumptions, productions):
-		mo = MeritOrder(prices, p, c)
-		co2.append(mo.getReleasedCO2())
+def get_co2(team_stats, team):
+	co2 = [mo.getReleasedCO2() for mo in get_merit_orders(team_stats, team)]
 
 	return np.sum(co2)
 
@@ -104,14 +106,7 @@ def get_max_price(team_stats, team):
 	return prices[Power.GAS] * total_cons
 
 def get_expenses(team_stats, team):
-	consumptions = team_stats[team]["consumptions"]
-	productions = team_stats[team]["productions"]
-
-	expenses = []
-
-	for (c, p) in zip(consumptions, productions):
-		mo = MeritOrder(prices, p, c)
-		expenses.append(mo.getTotalExpenses())
+	expenses = [mo.getTotalExpenses() for mo in get_merit_orders(team_stats, team)]
 
 	return np.sum(expenses)
 
@@ -149,28 +144,14 @@ def get_balance(team_stats, team, num_rounds):
 
 	one_round = 1 / num_rounds
 
-	one_perc = []
-
-	for r in c:
-		one_perc.append(BALANCE_CUTOFF_PERCENT * 0.01 * r)
-
-	balance_stats = []
-
-	for pdif, op in zip(pd, one_perc):
-		if abs(pdif) <= 1:
-			balance_stats.append(one_round)
-		
-		elif abs(pdif) > op:
-			balance_stats.append(0)
-
-		else:
-			err = (abs(pdif) / op) * one_round if op != 0 else 0
-
-			balance_stats.append(err)
+	one_perc = BALANCE_CUTOFF_PERCENT * 0.01 * c
+	abs_pdif = np.abs(pd)
 
-		#print(f"op: {op}, abspdif: {abs(pdif)}")
+	# Per round: full score within 1 MW, nothing beyond the cutoff, proportional in between
+	with np.errstate(divide='ignore', invalid='ignore'):
+		err = np.where(one_perc != 0, (abs_pdif / one_perc) * one_round, 0)
 
-	#print(f"bs: {balance_stats}")
+	balance_stats = np.where(abs_pdif <= 1, one_round, np.where(abs_pdif > one_perc, 0, err))
 
 	return balance_stats
 
@@ -212,8 +193,8 @@ def get_scores(team_stats, team, num_rounds):
 	}
 
 def calculate_final_scores(history):
-	import sys
-	debug_print(f"history = {history}")
+	if DEBUG:  # formatting the whole history is expensive, skip it unless it will be printed
+		debug_print(f"history = {history}")
 	
 
 	ts = get_team_stats(history)
@@ -1,8 +1,10 @@
 import jwt
 import hashlib
+import hmac
 import secrets
 import sqlite3
 import os
+import time
 from datetime import datetime, timedelta
 from functools import wraps
 from flask import request, jsonify
@@ -11,10 +13,14 @@ from flask import request, jsonify
 JWT_SECRET = os.environ.get('JWT_SECRET', 'your-secret-key-change-in-production')
 JWT_ALGORITHM = 'HS256'
 TOKEN_EXPIRY_HOURS = 24
+# Verified token payloads kept so repeat requests with the same token skip signature checking and decoding
+TOKEN_CACHE_SIZE = 1024
 
 class SimpleAuth:
     def __init__(self, db_path='users.db'):
         self.db_path = db_path
+        self._token_cache = {}
+        self._user_rows = {}
         self.init_database()
         self.load_users_if_empty()
     
@@ -63,7 +69,8 @@ class SimpleAuth:
     def verify_password(self, password, hashed_password, salt):
         """Verify password against hash"""
         test_hash, _ = self.hash_password(password, salt)
-        return test_hash == hashed_password
+        # Constant-time compare so response timing does not leak how much of the hash matched
+        return hmac.compare_digest(test_hash, hashed_password)
     
     def create_user(self, username, password, user_type, group_id='group1'):
         """Create a new user"""
@@ -87,16 +94,23 @@ class SimpleAuth:
     
     def authenticate_user(self, username, password):
         """Authenticate user and return user info if valid"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT id, username, password_hash, salt, user_type, group_id
-            FROM users WHERE username = ?
-        ''', (username,))
-        
-        user = cursor.fetchone()
-        conn.close()
+        # Users are only ever inserted, never updated or deleted, so a row once read stays valid
+        # and repeat logins skip opening the database; the password is still verified every time
+        user = self._user_rows.get(username)
+        if user is None:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                SELECT id, username, password_hash, salt, user_type, group_id
+                FROM users WHERE username = ?
+            ''', (username,))
+            
+            user = cursor.fetchone()
+            conn.close()
+            
+            if user:
+                self._user_rows[username] = user
         
         if user and self.verify_password(password, user[2], user[3]):
             return {
@@ -185,13 +199,23 @@ class SimpleAuth:
 
     def verify_token(self, token):
         """Verify JWT token and return user info"""
+        # Boards poll with the same token many times a second; only the expiry can change its validity
+        payload = self._token_cache.get(token)
+        if payload is not None and payload['exp'] > time.time():
+            return payload
+        
         try:
             payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
-            return payload
         except jwt.ExpiredSignatureError:
+            self._token_cache.pop(token, None)
             return None  # Token expired
         except jwt.InvalidTokenError:
             return None  # Invalid token
+        
+        if len(self._token_cache) >= TOKEN_CACHE_SIZE:
+            self._token_cache.clear()
+        self._token_cache[token] = payload
+        return payload
     
     def load_users_if_empty(self):
         """Load users from configuration files if database is empty"""
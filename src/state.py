@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import time
@@ -24,6 +24,15 @@ def debug_print(message):
     if DEBUG:
         print(f"DEBUG: {message}")
 
+def get_game_round_type(script: Script) -> Optional['Enak.RoundType']:
+    """Return the script's current round type if it is a game round (DAY/NIGHT), otherwise None"""
+    current_round = script.getCurrentRound()
+    if current_round and hasattr(current_round, 'getRoundType'):
+        round_type = current_round.getRoundType()
+        if round_type in (Enak.RoundType.DAY, Enak.RoundType.NIGHT):
+            return round_type
+    return None
+
 available_script_generators: Dict[str, Callable[[], Script]] = {
     #"test": getTestScript,
     "workshop - dlouhý": getNormalLongScript,
@@ -59,22 +68,48 @@ class GameState:
     def __init__(self, script):
         self.boards: Dict[str, 'BoardState'] = {}
         self.script = script
+        # ((script, round index), production coefficients, building consumptions)
+        self._round_coefficients = None
 
     def get_script(self) -> Script:
         """
         Returns the script associated with the game state.
         """
         return self.script
+
+    def get_round_coefficients(self) -> Tuple[Dict, Dict]:
+        """
+        Returns (production coefficients, building consumptions) for the script's current round.
+        Every board in the group polls the same values, so they are computed once per round and
+        published as a single tuple that concurrent pollers read without locking.
+        The returned dicts are shared and must not be modified.
+        """
+        script = self.script
+        key = (script, script.current_round_index)
+        snapshot = self._round_coefficients
+        if snapshot is not None and snapshot[0] == key:
+            return snapshot[1], snapshot[2]
+        
+        prod_coeffs = script.getCurrentProductionCoefficients()
+        cons_coeffs = {}
+        for building in Enak.Building:
+            consumption = script.getCurrentBuildingConsumption(building)
+            if consumption is not None:
+                cons_coeffs[building] = consumption
+        
+        self._round_coefficients = (key, prod_coeffs, cons_coeffs)
+        return prod_coeffs, cons_coeffs
     
     def register_board(self, board_id: str) -> 'BoardState':
         """
         Registers a new board in the game state.
         """
         debug_print(f"Registering board: {board_id}")
-        if board_id not in self.boards:
-            self.boards[board_id] = BoardState(board_id)
+        board = self.boards.get(board_id)
+        if board is None:
+            board = self.boards[board_id] = BoardState(board_id)
             debug_print(f"Board {board_id} registered successfully.")
-        return self.boards[board_id]
+        return board
 
     def reset_for_new_game(self):
         """Reset per-game state for all boards while keeping registrations.
@@ -93,27 +128,42 @@ class GameState:
         """
         Retrieves the board state by ID.
         """
-        debug_print(f"Retrieving board: {board_id}")
-        debug_print(str(self.boards))
-        if board_id in self.boards:
-            return self.boards[board_id]
-        raise KeyError(f"Board with ID {board_id} not found in game state.")
+        # Called on every board request: don't format the debug messages unless they are printed,
+        # and look the board up once
+        if DEBUG:
+            debug_print(f"Retrieving board: {board_id}")
+            debug_print(str(self.boards))
+        board = self.boards.get(board_id)
+        if board is None:
+            raise KeyError(f"Board with ID {board_id} not found in game state.")
+        return board
 
     def save_all_boards_current_round_to_history(self):
         """
         Save the current round data to history for all boards.
         This should be called when advancing to the next round.
         """
+        if not self.script:
+            for board in self.boards.values():
+                board.save_current_round_to_history(None)
+            return
+
+        # The round type is the same for every board, so resolve it once instead of per board
+        round_type = get_game_round_type(self.script)
+        if round_type is None:
+            debug_print(f"Skipping history save for non-game round {self.script.current_round_index}")
+            return
         for board in self.boards.values():
-            board.save_current_round_to_history(self.script)
+            if board.current_round_index >= 0:
+                board.append_round_to_history(round_type.name)
 
     def finalize_all_boards_current_round(self):
         """
         Finalize the current round for all boards.
         This should be called when the game ends or when transitioning rounds.
         """
+        self.save_all_boards_current_round_to_history()
         for board in self.boards.values():
-            board.finalize_current_round(self.script)
             board.clear_connected_buildings()  # Clear buildings when game/scenario ends
     
     def prune_disconnected_boards(self, timeout: float = None):
@@ -153,21 +203,24 @@ class GameState:
             }
         return summary
 
-    def get_connection_summary(self) -> Dict[str, any]:
+    def get_connection_summary(self, now: float = None) -> Dict[str, any]:
         """
         Get a summary of board connection status.
         """
+        if now is None:
+            now = time.time()
         connected_boards = []
         disconnected_boards = []
         
         for board_id, board in self.boards.items():
+            time_since_update = board.time_since_last_update(now)
             board_info = {
                 'board_id': board_id,
                 'display_name': board.display_name,
-                'time_since_update': board.time_since_last_update()
+                'time_since_update': time_since_update
             }
             
-            if board.is_connected():
+            if time_since_update <= board.CONNECTION_TIMEOUT:
                 connected_boards.append(board_info)
             else:
                 board_info['last_updated'] = board.last_updated
@@ -181,6 +234,16 @@ class GameState:
             'disconnected_boards': disconnected_boards
         }
 
+    def get_all_board_status(self) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Snapshot all boards against a single clock reading, so the per-board
+        'connected' flags and the connection summary always agree.
+        Returns (list of BoardState.to_dict() entries, connection summary).
+        """
+        now = time.time()
+        all_boards = [board.to_dict(now) for board in self.boards.values()]
+        return all_boards, self.get_connection_summary(now)
+
 
 class BoardState:
     """
@@ -252,20 +315,18 @@ class BoardState:
         # Connected buildings for persistence across board restarts
         self.connected_buildings: List[Dict[str, Any]] = []
 
-    def is_connected(self) -> bool:
+    def is_connected(self, now: float = None) -> bool:
         """
         Check if the board is considered connected based on last update time.
         Returns False if the board hasn't updated within CONNECTION_TIMEOUT seconds.
         """
-        current_time = time.time()
-        time_since_update = current_time - self.last_updated
-        return time_since_update <= self.CONNECTION_TIMEOUT
+        return self.time_since_last_update(now) <= self.CONNECTION_TIMEOUT
 
-    def time_since_last_update(self) -> float:
+    def time_since_last_update(self, now: float = None) -> float:
         """
-        Returns the time in seconds since the last update.
+        Returns the time in seconds since the last update (relative to `now` if given).
         """
-        return time.time() - self.last_updated
+        return (time.time() if now is None else now) - self.last_updated
 
     def update_last_activity(self):
         """
@@ -294,49 +355,40 @@ class BoardState:
         Only saves for game rounds (DAY/NIGHT), not for slide rounds.
         This should be called when advancing to the next round.
         """
-        # Only save history for game rounds (DAY/NIGHT)
-        if script and self.current_round_index >= 0:
-            current_round = script.getCurrentRound()
-            if current_round and hasattr(current_round, 'getRoundType'):
-                from enak import Enak
-                round_type = current_round.getRoundType()
-                # Only save for DAY and NIGHT rounds, not SLIDE or SLIDE_RANGE
-                if round_type in [Enak.RoundType.DAY, Enak.RoundType.NIGHT]:
-                    self.production_history.append(self.production)
-                    self.consumption_history.append(self.consumption)
-                    self.round_history.append(self.current_round_index)
-                    
-                    # Save power plant data for this round
-                    powerplant_data = {
-                        'round_index': self.current_round_index,
-                        'round_type': round_type.name,
-                        'connected_production': self.connected_production.copy(),
-                        'power_generation_by_type': self.power_generation_by_type.copy(),
-                        'total_production': self.production,
-                        'timestamp': time.time()
-                    }
-                    self.powerplant_history.append(powerplant_data)
-                    
-                    debug_print(f"Board {self.id}: Saved game round {self.current_round_index} ({round_type.name}) to history - Production: {self.production}, Consumption: {self.consumption}, Power plants: {self.power_generation_by_type}")
-                else:
-                    debug_print(f"Board {self.id}: Skipping history save for non-game round {self.current_round_index} ({round_type.name})")
-        elif self.current_round_index >= 0:
+        if self.current_round_index < 0:
+            return
+        if script:
+            # Only save history for game rounds (DAY/NIGHT)
+            round_type = get_game_round_type(script)
+            if round_type is None:
+                debug_print(f"Board {self.id}: Skipping history save for non-game round {self.current_round_index}")
+                return
+            self.append_round_to_history(round_type.name)
+        else:
             # Fallback for when script is not available - save anyway
-            self.production_history.append(self.production)
-            self.consumption_history.append(self.consumption)
-            self.round_history.append(self.current_round_index)
-            
-            powerplant_data = {
-                'round_index': self.current_round_index,
-                'round_type': 'UNKNOWN',
-                'connected_production': self.connected_production.copy(),
-                'power_generation_by_type': self.power_generation_by_type.copy(),
-                'total_production': self.production,
-                'timestamp': time.time()
-            }
-            self.powerplant_history.append(powerplant_data)
-            
-            debug_print(f"Board {self.id}: Saved round {self.current_round_index} to history (no script) - Production: {self.production}, Consumption: {self.consumption}")
+            self.append_round_to_history('UNKNOWN')
+
+    def append_round_to_history(self, round_type_name: str):
+        """
+        Append the current production, consumption and power plant values to history
+        under the board's current round index, without checking the round type.
+        """
+        self.production_history.append(self.production)
+        self.consumption_history.append(self.consumption)
+        self.round_history.append(self.current_round_index)
+
+        # Save power plant data for this round
+        powerplant_data = {
+            'round_index': self.current_round_index,
+            'round_type': round_type_name,
+            'connected_production': self.connected_production.copy(),
+            'power_generation_by_type': self.power_generation_by_type.copy(),
+            'total_production': self.production,
+            'timestamp': time.time()
+        }
+        self.powerplant_history.append(powerplant_data)
+
+        debug_print(f"Board {self.id}: Saved round {self.current_round_index} ({round_type_name}) to history - Production: {self.production}, Consumption: {self.consumption}, Power plants: {self.power_generation_by_type}")
 
     def finalize_current_round(self, script: 'Script' = None):
         """
@@ -452,6 +504,19 @@ class BoardState:
         self.connected_buildings = [b for b in self.connected_buildings if b['uid'] != uid]
         self.update_last_activity()
 
+    def replace_connected_buildings(self, buildings: List[Dict[str, Any]]):
+        """
+        Replace all connected buildings in one pass.
+        A uid seen more than once keeps its last building_type, placed where that last occurrence was.
+        """
+        by_uid = {}
+        for building in buildings:
+            uid = building['uid']
+            by_uid.pop(uid, None)
+            by_uid[uid] = {'uid': uid, 'building_type': building['building_type']}
+        self.connected_buildings = list(by_uid.values())
+        self.update_last_activity()
+
     def get_connected_buildings(self) -> List[Dict[str, Any]]:
         """
         Get the list of connected buildings.
@@ -489,18 +554,21 @@ class BoardState:
         self.connected_buildings = []
         self.update_last_activity()
 
-    def to_dict(self):
+    def to_dict(self, now: float = None):
         """
         Returns a dictionary representation of the board state.
         """
+        if now is None:
+            now = time.time()
+        time_since_update = now - self.last_updated
         return {
             "board_id": self.id,
             "display_name": self.display_name,
             "production": self.production,
             "consumption": self.consumption,
             "last_updated": self.last_updated,
-            "connected": self.is_connected(),
-            "time_since_update": self.time_since_last_update(),
+            "connected": time_since_update <= self.CONNECTION_TIMEOUT,
+            "time_since_update": time_since_update,
             "connected_consumption": self.connected_consumption,
             "connected_production": self.connected_production,
             "production_history": self.production_history,
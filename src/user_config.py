@@ -7,8 +7,13 @@ and provides them in the         display_name = board_config.get("display_name")
         return display_namemat expected by the authentication system.
 """
 
-import toml
 import os
+
+try:
+    import tomllib  # stdlib on Python 3.11+, faster than the toml package
+except ImportError:
+    tomllib = None
+    import toml
 from typing import List, Dict, Any, Optional
 
 # Global debug flag from environment variable
@@ -31,14 +36,20 @@ class UserConfig:
         """
         self.config_file = config_file
         self.config = {}
+        self._users = []
+        self._users_by_name = {}
         self.load_config()
     
     def load_config(self):
         """Load configuration from TOML file"""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    self.config = toml.load(f)
+                if tomllib is not None:
+                    with open(self.config_file, 'rb') as f:
+                        self.config = tomllib.load(f)
+                else:
+                    with open(self.config_file, 'r', encoding='utf-8') as f:
+                        self.config = toml.load(f)
                 print(f"✓ Loaded user configuration from {self.config_file}")
                 
                 # Debug logging for boards with display names
@@ -56,6 +67,11 @@ class UserConfig:
             print(f"⚠️  Error loading configuration: {e}")
             print("Using default configuration")
             self.config = self._get_default_config()
+        
+        # User records only change on (re)load, so build them once here
+        self._users = self._build_users()
+        # reversed so the first entry wins on duplicate names, as with the old linear search
+        self._users_by_name = {user["username"]: user for user in reversed(self._users)}
     
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default configuration if file is not available"""
@@ -76,8 +92,13 @@ class UserConfig:
         Get all users (both lecturers and boards) in the format expected by SimpleAuth
         
         Returns:
-            List of user dictionaries with username, password, user_type, group_id, and name
+            List of user dictionaries with username, password, user_type, group_id, and name.
+            The list is cached until the next reload and must not be modified.
         """
+        return self._users
+    
+    def _build_users(self) -> List[Dict[str, Any]]:
+        """Build the user records returned by get_all_users from the loaded configuration"""
         users = []
         
         # Add lecturers
@@ -138,11 +159,7 @@ class UserConfig:
     
     def get_user(self, username: str) -> Optional[Dict[str, Any]]:
         """Get a specific user by username"""
-        all_users = self.get_all_users()
-        for user in all_users:
-            if user["username"] == username:
-                return user
-        return None
+        return self._users_by_name.get(username)
     
     def get_groups(self) -> Dict[str, Any]:
         """Get group configuration"""
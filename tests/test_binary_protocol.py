@@ -0,0 +1,40 @@
+import struct
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from binary_protocol import BoardBinaryProtocol, BinaryProtocolError  # noqa: E402
+
+POWER_FRAME_SIZE = 8  # production(4) + consumption(4)
+
+
+def test_power_values_batch_matches_scalar_frames():
+    production = [0.0, 1.5, -2.25, 123.4567, 2147483.647, -2147483.648, 0.0004]
+    consumption = [3.0, -0.001, 999.999, 0.5, -2147483.648, 2147483.647, -0.0009]
+
+    packed = BoardBinaryProtocol.pack_power_values_batch(production, consumption)
+
+    assert len(packed) == POWER_FRAME_SIZE * len(production)
+    for i, (p, c) in enumerate(zip(production, consumption)):
+        scalar = BoardBinaryProtocol.pack_power_data(p, c)[:POWER_FRAME_SIZE]
+        assert packed[i * POWER_FRAME_SIZE:(i + 1) * POWER_FRAME_SIZE] == scalar
+
+    prod_w, cons_w = BoardBinaryProtocol.unpack_power_values_batch(packed)
+    for i in range(len(production)):
+        expected = BoardBinaryProtocol.unpack_power_values(packed[i * POWER_FRAME_SIZE:(i + 1) * POWER_FRAME_SIZE])
+        assert (prod_w[i], cons_w[i]) == expected
+
+
+@pytest.mark.parametrize("value", [3e6, -3e6, 2147483.648, float("nan"), float("inf")])
+def test_power_values_batch_rejects_what_the_scalar_path_rejects(value):
+    with pytest.raises((struct.error, ValueError, OverflowError)):
+        BoardBinaryProtocol.pack_power_data(value, 1.0)
+
+    with pytest.raises(BinaryProtocolError):
+        BoardBinaryProtocol.pack_power_values_batch(np.array([1.0, value]), np.array([1.0, 1.0]))
+    with pytest.raises(BinaryProtocolError):
+        BoardBinaryProtocol.pack_power_values_batch(np.array([1.0, 1.0]), np.array([value, 1.0]))
@@ -0,0 +1,109 @@
+import importlib.util
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / "presentations" / "fix_svg_margins.py"
+
+SVG = b'<svg xmlns="http://www.w3.org/2000/svg" width="10" height="20"><rect width="5" height="5"/></svg>'
+
+
+def write_svgs(directory, count):
+    paths = []
+    for i in range(count):
+        path = directory / f"slide{i}.svg"
+        path.write_bytes(SVG)
+        paths.append(str(path))
+    return paths
+
+
+def test_parallel_aspect_none(tmp_path):
+    """-j > 1 goes through the process pool branch of main()"""
+    svgs = write_svgs(tmp_path, 3)
+    outdir = tmp_path / "out"
+
+    proc = subprocess.run(
+        [sys.executable, str(SCRIPT), "-j", "2", "--method", "aspect-none", "-o", str(outdir), *svgs],
+        capture_output=True, text=True, timeout=120,
+    )
+
+    assert proc.returncode == 0, proc.stderr
+    assert "Done. 3/3 files processed OK." in proc.stdout
+    for i in range(3):
+        data = (outdir / f"slide{i}.svg").read_bytes()
+        assert b'preserveAspectRatio="none"' in data
+        assert b'viewBox="0 0 10.0 20.0"' in data
+
+
+def load_script():
+    spec = importlib.util.spec_from_file_location("fix_svg_margins", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class RingWithoutPrep:
+    """liburing stand-in whose ring sets up fine but has a different submission API"""
+
+    class Ring:
+        pass
+
+    class Cqe:
+        pass
+
+    @staticmethod
+    def io_uring_queue_init(entries, ring, flags):
+        pass
+
+    @staticmethod
+    def io_uring_queue_exit(ring):
+        pass
+
+    @staticmethod
+    def io_uring_get_sqe(ring):
+        return object()
+
+
+def open_fd_count():
+    return len(os.listdir("/proc/self/fd"))
+
+
+@pytest.mark.parametrize("liburing", [object(), RingWithoutPrep], ids=["no-ring-api", "no-prep-api"])
+def test_io_uring_falls_back_on_liburing_api_mismatch(tmp_path, monkeypatch, liburing):
+    script = load_script()
+    monkeypatch.setattr(script, "_import_liburing", lambda: liburing)
+    svgs = write_svgs(tmp_path, 3)
+    fds_before = open_fd_count()
+
+    assert script.read_inputs(svgs, jobs=2) == [SVG] * 3
+
+    outputs = [(str(tmp_path / f"out{i}.svg"), SVG) for i in range(3)]
+    assert script.write_outputs(outputs) == {}
+    for out_path, data in outputs:
+        assert Path(out_path).read_bytes() == data
+
+    assert open_fd_count() == fds_before
+
+
+@pytest.mark.parametrize("prolog", [
+    b'<!-- exported from <svg> editor -->\n',
+    b'<?xml version="1.0"?>\n<!DOCTYPE svg [ <!ENTITY logo "<svg>"> ]>\n',
+], ids=["comment", "doctype"])
+def test_aspect_stream_patches_root_not_prolog(prolog):
+    script = load_script()
+
+    fixed = script.method_aspect_stream("slide.svg", "none", prolog + SVG)
+
+    assert fixed.startswith(prolog)
+    root = fixed[len(prolog):]
+    assert root.startswith(b'<svg xmlns="http://www.w3.org/2000/svg" width="10.0px" height="20.0px"')
+    assert b'preserveAspectRatio="none"' in root
+
+
+def test_aspect_stream_leaves_non_svg_root_to_dom_fallback():
+    script = load_script()
+
+    assert script.method_aspect_stream("slide.svg", "none", b'<!-- <svg> --><g><svg/></g>') is None